@@ -10,17 +10,23 @@ from enum import Enum
 from app.api.deps import CurrentUser, SessionDep
 from pydantic import BaseModel, Field
 from sqlmodel import select, func, and_, or_
+from sqlalchemy.orm import defer
 from uuid import UUID
 import json
+import re
 
 from app.models import BacktestResult
-from app.domains.strategies.services import StrategyService
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
 router = APIRouter(prefix="/backtests", tags=["backtests"])
-strategy_service = StrategyService()
+
+# Canonical hyphenated form, the format the API itself returns. Used with
+# fullmatch, since a "$" anchor would also accept a trailing newline
+_UUID_RE = re.compile(
+    r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+)
 
 
 class BacktestSTatus(str, Enum):
@@ -156,13 +162,12 @@ async def list_all_backtests(
                     detail="Invalid start_date_to format, use YYYY-MM-DD",
                 )
 
-        count_statement = select(func.count(BacktestResult.id))
-        if conditions:
-            count_statement = count_statement.where(and_(*conditions))
-
-        total_count = session.exec(count_statement).one()
-
-        statement = select(BacktestResult)
+        # The summary metrics are stored as columns, so the potentially large
+        # result_data blob is neither fetched nor parsed for list pages. The
+        # total rides along as a window count instead of a second query.
+        statement = select(
+            BacktestResult, func.count().over().label("total")
+        ).options(defer(BacktestResult.result_data))
         if conditions:
             statement = statement.where(and_(*conditions))
 
@@ -175,12 +180,22 @@ async def list_all_backtests(
         offset = (page - 1) * size
         statement = statement.offset(offset).limit(size)
 
-        results = session.exec(statement).all()
+        rows = session.exec(statement).all()
+        results = [row[0] for row in rows]
+
+        if rows:
+            total_count = rows[0][1]
+        elif offset:
+            # Past the last page there is no row to carry the window count
+            count_statement = select(func.count(BacktestResult.id))
+            if conditions:
+                count_statement = count_statement.where(and_(*conditions))
+            total_count = session.exec(count_statement).one()
+        else:
+            total_count = 0
 
         backtest_items = []
         for result in results:
-            result_data = json.loads(result.result_data) if result.result_data else {}
-
             item = GlobalBacktestItem(
                 backtest_id=str(result.id),
                 strategy_name=result.strategy_name,
@@ -197,14 +212,12 @@ async def list_all_backtests(
                 winning_trades=result.winning_trades,
                 losing_trades=result.losing_trades,
                 win_rate=result.win_rate,
-                avg_win=result_data.get("performance", {}).get("avg_win"),
-                avg_loss=result_data.get("performance", {}).get("avg_loss"),
-                avg_annual_return=result_data.get("performance", {}).get(
-                    "avg_annual_return"
-                ),
-                vwr=result_data.get("performance", {}).get("vwr"),
-                calmar_ratio=result_data.get("performance", {}).get("calmar_ratio"),
-                sqn=result_data.get("performance", {}).get("sqn"),
+                avg_win=result.avg_win,
+                avg_loss=result.avg_loss,
+                avg_annual_return=result.avg_annual_return,
+                vwr=result.vwr,
+                calmar_ratio=result.calmar_ratio,
+                sqn=result.sqn,
                 status="completed",  # All stored results are completed
                 created_at=result.created_at.isoformat(),
                 created_by=result.created_by,
@@ -302,21 +315,23 @@ async def compare_backtests(
                 status_code=400, detail="Maximum 10 backtests can be compared at once"
             )
 
-        backtest_uuids = []
         for backtest_id in backtest_ids:
-            try:
-                backtest_uuids.append(UUID(backtest_id))
-            except ValueError:
+            if not _UUID_RE.fullmatch(backtest_id):
                 raise HTTPException(
                     status_code=400, detail=f"Invalid backtest ID: {backtest_id}"
                 )
+        backtest_uuids = [UUID(backtest_id) for backtest_id in backtest_ids]
 
         statement = select(BacktestResult).where(BacktestResult.id.in_(backtest_uuids))
         results = session.exec(statement).all()
 
-        if len(results) != len(backtest_uuids):
-            found_ids = [str(r.id) for r in results]
-            missing_ids = [bid for bid in backtest_ids if bid not in found_ids]
+        found_ids = {r.id for r in results}
+        missing_ids = [
+            bid
+            for bid, buuid in zip(backtest_ids, backtest_uuids, strict=True)
+            if buuid not in found_ids
+        ]
+        if missing_ids:
             raise HTTPException(
                 status_code=404, detail=f"Backtests not found: {missing_ids}"
             )
@@ -12,6 +12,11 @@ import pandas as pd
 router = APIRouter(prefix="/data", tags=["data"])
 data_service = DataService()
 
+# Quoted prices carry at most a few decimals, anything past this is float noise
+# that only lengthens the JSON response
+_PRICE_COLUMNS = ("open", "high", "low", "close")
+_PRICE_DECIMALS = 4
+
 
 class StockDataRequest(BaseModel):
     """Stock data request model (for daily, minute, financial)"""
@@ -105,6 +110,10 @@ async def fetch_stock_data(
 
     df = await data_service.fetch_data(**kwargs)
 
+    price_columns = [c for c in _PRICE_COLUMNS if c in df.columns]
+    if price_columns and not df.empty:
+        df = df.round(dict.fromkeys(price_columns, _PRICE_DECIMALS))
+
     data = df.to_dict("records") if not df.empty else []
     columns = df.columns.tolist() if not df.empty else []
 
@@ -9,9 +9,7 @@ from sqlmodel import select
 
 router = APIRouter(prefix="/strategies", tags=["strategies"])
 
-from app.domains.strategies.services import StrategyService
-
-strategy_service = StrategyService()
+from app.domains.strategies.services import strategy_service
 
 from typing import Any, List
 from app.api.deps import CurrentUser, SessionDep
@@ -0,0 +1,24 @@
+"""
+Optional Numba JIT support for numeric hot paths
+
+Numba is not a hard dependency. When it is missing, ``njit`` degrades to a
+no-op decorator so kernels still run as plain Python.
+"""
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit, supports bare and called usage"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
+
@@ -1,7 +1,8 @@
 import asyncio
 import json
-from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from typing import List, Optional, Dict, Any, Tuple
 import pandas as pd
 from influxdb_client import InfluxDBClient, Point
 from influxdb_client.client.write_api import SYNCHRONOUS
@@ -12,6 +13,11 @@ from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Number of fetched frames kept in memory, least recently used are dropped first
+_MEMO_SIZE = 128
+# Symbols fetched at once by fetch_many, the SDK calls each hold a worker thread
+_FETCH_CONCURRENCY = 8
+
 
 class DataService:
     def __init__(self):
@@ -28,6 +34,35 @@ class DataService:
         self.write_api = self.influxdb_client.write_api(write_options=SYNCHRONOUS)
         self.query_api = self.influxdb_client.query_api()
 
+        # Frames for date ranges that ended before today, most recently used last
+        self._memo: OrderedDict[Tuple[str, str, str, str], pd.DataFrame] = (
+            OrderedDict()
+        )
+
+    def _memo_get(self, key: Tuple[str, str, str, str]) -> Optional[pd.DataFrame]:
+        data = self._memo.get(key)
+        if data is not None:
+            self._memo.move_to_end(key)
+        return data
+
+    def _memo_put(self, key: Tuple[str, str, str, str], data: pd.DataFrame) -> None:
+        # Ranges reaching today or later may still gain rows, and ranges
+        # without a parseable end date are never complete
+        try:
+            end = datetime.strptime(key[3], "%Y-%m-%d").date()
+        except ValueError:
+            return
+        if end >= date.today():
+            return
+
+        self._memo[key] = data
+        self._memo.move_to_end(key)
+        if len(self._memo) > _MEMO_SIZE:
+            self._memo.popitem(last=False)
+
+    def clear_memo(self) -> None:
+        self._memo.clear()
+
     async def fetch_data(
         self,
         data_type: str,
@@ -36,6 +71,18 @@ class DataService:
         end_date: str,
         use_cache=True,
     ) -> pd.DataFrame:
+        """
+        Fetch data from InfluxDB or the data sources
+
+        With use_cache, frames for past date ranges are also kept in memory and
+        the same frame is returned on later calls, so it must not be mutated
+        """
+        key = (data_type, symbol, start_date, end_date)
+        if use_cache:
+            memoized = self._memo_get(key)
+            if memoized is not None:
+                return memoized
+
         try:
             if use_cache:
                 cached_data = await self.get_data_from_influxdb(
@@ -79,6 +126,7 @@ class DataService:
                             f"Using cached {data_type} data for {symbol} from InfluxDB "
                             f"({actual_points} points, covers {cached_start.date()} to {cached_end.date()})"
                         )
+                        self._memo_put(key, cached_data)
                         return cached_data
                     else:
                         logger.info(
@@ -121,6 +169,7 @@ class DataService:
                     fields=fields,
                 )
                 logger.info(f"Stored {data_type} data for {symbol} to InfluxDB")
+                self._memo_put(key, data)
 
             return data
 
@@ -128,6 +177,37 @@ class DataService:
             logger.error(f"Error fetching data for {symbol}: {e}")
             return pd.DataFrame()
 
+    async def fetch_many(
+        self,
+        data_type: str,
+        symbols: List[str],
+        start_date: str,
+        end_date: str,
+        use_cache=True,
+        max_concurrency: int = _FETCH_CONCURRENCY,
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch the same date range for several symbols concurrently
+
+        Returns a frame per distinct symbol, empty where the fetch failed
+        """
+        # Each symbol is fetched once, in first-seen order
+        symbols = list(dict.fromkeys(symbols))
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch_one(symbol: str) -> pd.DataFrame:
+            async with semaphore:
+                return await self.fetch_data(
+                    data_type=data_type,
+                    symbol=symbol,
+                    start_date=start_date,
+                    end_date=end_date,
+                    use_cache=use_cache,
+                )
+
+        frames = await asyncio.gather(*(fetch_one(symbol) for symbol in symbols))
+        return dict(zip(symbols, frames, strict=True))
+
     async def store_data_to_influxdb(
         self,
         measurement: str,
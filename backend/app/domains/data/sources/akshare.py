@@ -14,7 +14,8 @@ class AkshareDataSource(DataSource):
 
     async def health_check(self) -> bool:
         try:
-            test_data = ak.stock_zh_a_hist(
+            test_data = await asyncio.to_thread(
+                ak.stock_zh_a_hist,
                 symbol="000001",
                 period="daily",
                 start_date="20240101",
@@ -129,7 +130,8 @@ class AkshareDataSource(DataSource):
         try:
 
             ak_symbol = symbol.split(".")[0] if "." in symbol else symbol
-            df = ak.stock_zh_a_hist(
+            df = await asyncio.to_thread(
+                ak.stock_zh_a_hist,
                 symbol=ak_symbol,
                 period="daily",
                 start_date=start_date.replace("-", ""),
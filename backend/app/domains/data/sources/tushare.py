@@ -1,3 +1,4 @@
+import asyncio
 from app.domains.data.sources.base import DataSource
 import tushare as ts
 import pandas as pd
@@ -27,7 +28,8 @@ class TushareDataSource(DataSource):
             if not self.pro:
                 return False
 
-            test_data = ts.pro_bar(
+            test_data = await asyncio.to_thread(
+                ts.pro_bar,
                 ts_code="000001.SZ",
                 start_date="20240101",
                 end_date="20240102",
@@ -110,7 +112,8 @@ class TushareDataSource(DataSource):
                 logger.error("Tushare pro API not initialized")
                 return pd.DataFrame()
 
-            df = ts.pro_bar(
+            df = await asyncio.to_thread(
+                ts.pro_bar,
                 ts_code=symbol,
                 start_date=start_date.replace("-", ""),
                 end_date=end_date.replace("-", ""),
@@ -153,7 +156,8 @@ class TushareDataSource(DataSource):
                 logger.error("Tushare pro API not initialized")
                 return pd.DataFrame()
 
-            df = self.pro.stk_mins(
+            df = await asyncio.to_thread(
+                self.pro.stk_mins,
                 ts_code=symbol,
                 start_date=start_date.replace("-", ""),
                 end_date=end_date.replace("-", ""),
@@ -183,15 +187,15 @@ class TushareDataSource(DataSource):
                 return pd.DataFrame()
 
             if indicator == "gdp":
-                df = self.pro.cn_gdp()
+                df = await asyncio.to_thread(self.pro.cn_gdp)
             elif indicator == "cpi":
-                df = self.pro.cn_cpi()
+                df = await asyncio.to_thread(self.pro.cn_cpi)
             elif indicator == "ppi":
-                df = self.pro.cn_ppi()
+                df = await asyncio.to_thread(self.pro.cn_ppi)
             elif indicator == "m2":
-                df = self.pro.cn_m2()
+                df = await asyncio.to_thread(self.pro.cn_m2)
             elif indicator == "interest_rate":
-                df = self.pro.shibor()
+                df = await asyncio.to_thread(self.pro.shibor)
             else:
                 logger.error(f"Unsupported macro indicator: {indicator}")
                 return pd.DataFrame()
@@ -224,7 +228,8 @@ class TushareDataSource(DataSource):
                 logger.error("Tushare pro API not initialized")
                 return pd.DataFrame()
 
-            df = self.pro.fina_indicator(
+            df = await asyncio.to_thread(
+                self.pro.fina_indicator,
                 ts_code=symbol,
                 start_date=start_date.replace("-", ""),
                 end_date=end_date.replace("-", ""),
@@ -250,7 +255,9 @@ class TushareDataSource(DataSource):
                 logger.error("Tushare pro API not initialized")
                 return pd.DataFrame()
 
-            df = self.pro.stock_basic(exchange="", list_status="L")
+            df = await asyncio.to_thread(
+                self.pro.stock_basic, exchange="", list_status="L"
+            )
 
             if df.empty:
                 return pd.DataFrame()
@@ -266,7 +273,7 @@ class TushareDataSource(DataSource):
                 logger.error("Tushare pro API not initialized")
                 return pd.DataFrame()
 
-            df = self.pro.concept()
+            df = await asyncio.to_thread(self.pro.concept)
 
             if df.empty:
                 return pd.DataFrame()
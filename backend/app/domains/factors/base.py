@@ -1,11 +1,16 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, Optional, List, Mapping, Tuple, Union
 import pandas as pd
 import numpy as np
 from datetime import datetime
 from enum import Enum
 
 
+# Shared qlib dependency tuples, returned as-is by the factors that use them
+QLIB_CLOSE_DEPENDENCIES = ("$close",)
+QLIB_HLC_DEPENDENCIES = ("$high", "$low", "$close")
+
+
 class FactorType(Enum):
     TECHNICAL = "technical"
     FUNDAMENTAL = "fundamental"
@@ -80,14 +85,30 @@ class Factor(ABC):
         self.status = FactorStatus.ACTIVE
         self.error_count = 0
 
+    # Factors are not reconfigured after __init__, so subclasses build the qlib
+    # expression and parameters once with functools.cached_property and return
+    # one of the shared QLIB_*_DEPENDENCIES tuples for dependencies
+    @property
     @abstractmethod
-    def get_qlib_expression(self) -> str:
+    def qlib_expression(self) -> str:
+        pass
+
+    @property
+    @abstractmethod
+    def qlib_dependencies(self) -> Tuple[str, ...]:
         pass
 
+    @property
     @abstractmethod
-    def get_qlib_dependencies(self) -> List[str]:
+    def qlib_parameters(self) -> Mapping[str, Any]:
         pass
 
+    def get_qlib_expression(self) -> str:
+        return self.qlib_expression
+
+    def get_qlib_dependencies(self) -> Tuple[str, ...]:
+        return self.qlib_dependencies
+
     def is_qlib_compatible(self) -> bool:
         return hasattr(self, "get_qlib_expression")
 
@@ -95,9 +116,8 @@ class Factor(ABC):
     def get_report_reference(self) -> Optional[str]:
         pass
 
-    @abstractmethod
-    def get_qlib_parameters(self) -> Dict[str, Any]:
-        pass
+    def get_qlib_parameters(self) -> Mapping[str, Any]:
+        return self.qlib_parameters
 
     def is_report_factor(self) -> bool:
         return (
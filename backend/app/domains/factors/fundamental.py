@@ -1,7 +1,9 @@
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, List, Optional
-from .base import Factor, FactorType
+from functools import cached_property
+from types import MappingProxyType
+from typing import Any, List, Mapping, Optional, Tuple
+from .base import Factor, FactorType, QLIB_CLOSE_DEPENDENCIES
 
 
 class FinancialRatioFactor(Factor):
@@ -54,7 +56,8 @@ class FinancialRatioFactor(Factor):
             self.record_error()
             raise e
 
-    def get_qlib_expression(self) -> str:
+    @cached_property
+    def qlib_expression(self) -> str:
         if self.parameters["ratio_type"] == "pe_ratio":
             return f"PE($close)"
         elif self.parameters["ratio_type"] == "pb_ratio":
@@ -65,11 +68,13 @@ class FinancialRatioFactor(Factor):
             return f"ROA($close)"
         return ""
 
-    def get_qlib_dependencies(self) -> List[str]:
-        return ["$close"]
+    @property
+    def qlib_dependencies(self) -> Tuple[str, ...]:
+        return QLIB_CLOSE_DEPENDENCIES
 
-    def get_qlib_parameters(self) -> Dict[str, Any]:
-        return {"ratio_type": self.parameters["ratio_type"]}
+    @cached_property
+    def qlib_parameters(self) -> Mapping[str, Any]:
+        return MappingProxyType({"ratio_type": self.parameters["ratio_type"]})
 
     def get_report_reference(self) -> Optional[str]:
         return f"财务比率因子: {self.parameters['ratio_type']}, 用于基本面分析"
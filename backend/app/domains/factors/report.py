@@ -1,7 +1,9 @@
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, List, Optional
-from .base import Factor, FactorType
+from functools import cached_property
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Tuple
+from .base import Factor, FactorType, QLIB_CLOSE_DEPENDENCIES
 
 
 class ReportFactor(Factor):
@@ -33,22 +35,27 @@ class ReportFactor(Factor):
         required_fields = self.get_required_fields()
         return all(field in data.columns for field in required_fields)
 
-    def get_qlib_expression(self) -> str:
+    @cached_property
+    def qlib_expression(self) -> str:
         return ""
 
-    def get_qlib_dependencies(self) -> List[str]:
-        return []
+    @property
+    def qlib_dependencies(self) -> Tuple[str, ...]:
+        return ()
 
     def get_report_reference(self) -> Optional[str]:
         return f"来源: {self.report_source}\n标题: {self.report_title}\n作者: {self.report_author}\n日期: {self.report_date}"
 
-    def get_qlib_parameters(self) -> Dict[str, Any]:
-        return {
-            "report_source": self.report_source,
-            "report_title": self.report_title,
-            "report_author": self.report_author,
-            "report_date": self.report_date,
-        }
+    @cached_property
+    def qlib_parameters(self) -> Mapping[str, Any]:
+        return MappingProxyType(
+            {
+                "report_source": self.report_source,
+                "report_title": self.report_title,
+                "report_author": self.report_author,
+                "report_date": self.report_date,
+            }
+        )
 
 
 class MomentumFactor(ReportFactor):
@@ -89,17 +96,22 @@ class MomentumFactor(ReportFactor):
             self.record_error()
             raise e
 
-    def get_qlib_expression(self) -> str:
+    @cached_property
+    def qlib_expression(self) -> str:
         return f"Ref($close, {self.lookback_period}) / $close - 1"
 
-    def get_qlib_dependencies(self) -> List[str]:
-        return ["$close"]
-
-    def get_qlib_parameters(self) -> Dict[str, Any]:
-        return {
-            "lookback_period": self.lookback_period,
-            "report_source": self.report_source,
-            "report_title": self.report_title,
-            "report_author": self.report_author,
-            "report_date": self.report_date,
-        }
+    @property
+    def qlib_dependencies(self) -> Tuple[str, ...]:
+        return QLIB_CLOSE_DEPENDENCIES
+
+    @cached_property
+    def qlib_parameters(self) -> Mapping[str, Any]:
+        return MappingProxyType(
+            {
+                "lookback_period": self.lookback_period,
+                "report_source": self.report_source,
+                "report_title": self.report_title,
+                "report_author": self.report_author,
+                "report_date": self.report_date,
+            }
+        )
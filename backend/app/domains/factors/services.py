@@ -3,14 +3,8 @@
 负责因子的计算, 存储和管理
 """
 
-import asyncio
-import json
-import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any, Tuple, Union
-from app.core.config import settings
-from app.domains.data.services import DataService
+from typing import List, Optional, Dict, Any
 from .base import Factor, FactorType
 from app.core.logging import get_logger
 
@@ -27,6 +21,13 @@ class FactorService:
             FactorType.MACRO: [],
             FactorType.SENTIMENT: [],
         }
+        # Lookup results cached until the next register/unregister
+        self._list_cache: Optional[List[str]] = None
+        self._type_cache: Dict[FactorType, List[Factor]] = {}
+
+    def _invalidate_caches(self) -> None:
+        self._list_cache = None
+        self._type_cache.clear()
 
     def register_factor(self, factor: Factor):
         try:
@@ -35,6 +36,7 @@ class FactorService:
 
             self.factors[factor.name] = factor
             self.factor_types[factor.factor_type].append(factor.name)
+            self._invalidate_caches()
             return True
         except Exception as e:
             logger.error(f"Error registering factor {factor.name}: {e}")
@@ -44,11 +46,21 @@ class FactorService:
         return self.factors.get(name)
 
     def get_factors_by_type(self, factor_type: FactorType) -> List[Factor]:
-        factor_names = self.factor_types.get(factor_type, [])
-        return [self.factors[name] for name in factor_names if name in self.factors]
+        """Factors of one type, the returned list is shared and must not be mutated"""
+        cached = self._type_cache.get(factor_type)
+        if cached is None:
+            factor_names = self.factor_types.get(factor_type, [])
+            cached = [
+                self.factors[name] for name in factor_names if name in self.factors
+            ]
+            self._type_cache[factor_type] = cached
+        return cached
 
     def list_factors(self) -> List[str]:
-        return list(self.factors.keys())
+        """Registered factor names, the returned list is shared and must not be mutated"""
+        if self._list_cache is None:
+            self._list_cache = list(self.factors.keys())
+        return self._list_cache
 
     def unregister_factor(self, name: str) -> bool:
         if name not in self.factors:
@@ -57,6 +69,7 @@ class FactorService:
         factor = self.factors[name]
         self.factor_types[factor.factor_type].remove(name)
         del self.factors[name]
+        self._invalidate_caches()
         return True
 
     async def calculate_factor(
@@ -1,8 +1,10 @@
 import pandas as pd
 import numpy as np
 import talib
-from typing import Dict, Any, List, Optional
-from .base import Factor, FactorType
+from functools import cached_property
+from types import MappingProxyType
+from typing import Any, List, Mapping, Optional, Tuple
+from .base import Factor, FactorType, QLIB_CLOSE_DEPENDENCIES, QLIB_HLC_DEPENDENCIES
 
 
 class MovingAverageFactor(Factor):
@@ -51,24 +53,29 @@ class MovingAverageFactor(Factor):
             self.record_error()
             raise e
 
-    def get_qlib_expression(self) -> str:
+    @cached_property
+    def qlib_expression(self) -> str:
         if self.parameters["ma_type"] == "SMA":
             return f"Mean($close, {self.parameters['period']})"
         elif self.parameters["ma_type"] == "EMA":
             return f"EMA($close, {self.parameters['period']})"
         return ""
 
-    def get_qlib_dependencies(self) -> List[str]:
-        return ["$close"]
+    @property
+    def qlib_dependencies(self) -> Tuple[str, ...]:
+        return QLIB_CLOSE_DEPENDENCIES
 
     def get_report_reference(self) -> Optional[str]:
         return None
 
-    def get_qlib_parameters(self) -> Dict[str, Any]:
-        return {
-            "period": self.parameters["period"],
-            "ma_type": self.parameters["ma_type"],
-        }
+    @cached_property
+    def qlib_parameters(self) -> Mapping[str, Any]:
+        return MappingProxyType(
+            {
+                "period": self.parameters["period"],
+                "ma_type": self.parameters["ma_type"],
+            }
+        )
 
 
 class RSIFactor(Factor):
@@ -103,14 +110,17 @@ class RSIFactor(Factor):
             self.record_error()
             raise e
 
-    def get_qlib_expression(self) -> str:
+    @cached_property
+    def qlib_expression(self) -> str:
         return f"RSI($close, {self.parameters['period']})"
 
-    def get_qlib_dependencies(self) -> List[str]:
-        return ["$close"]
+    @property
+    def qlib_dependencies(self) -> Tuple[str, ...]:
+        return QLIB_CLOSE_DEPENDENCIES
 
-    def get_qlib_parameters(self) -> Dict[str, Any]:
-        return {"period": self.parameters["period"]}
+    @cached_property
+    def qlib_parameters(self) -> Mapping[str, Any]:
+        return MappingProxyType({"period": self.parameters["period"]})
 
     def get_report_reference(self) -> Optional[str]:
         return None
@@ -172,18 +182,23 @@ class MACDFactor(Factor):
             self.record_error()
             raise e
 
-    def get_qlib_expression(self) -> str:
+    @cached_property
+    def qlib_expression(self) -> str:
         return f"MACD($close, {self.parameters['fast_period']}, {self.parameters['slow_period']}, {self.parameters['signal_period']})"
 
-    def get_qlib_dependencies(self) -> List[str]:
-        return ["$close"]
-
-    def get_qlib_parameters(self) -> Dict[str, Any]:
-        return {
-            "fast_period": self.parameters["fast_period"],
-            "slow_period": self.parameters["slow_period"],
-            "signal_period": self.parameters["signal_period"],
-        }
+    @property
+    def qlib_dependencies(self) -> Tuple[str, ...]:
+        return QLIB_CLOSE_DEPENDENCIES
+
+    @cached_property
+    def qlib_parameters(self) -> Mapping[str, Any]:
+        return MappingProxyType(
+            {
+                "fast_period": self.parameters["fast_period"],
+                "slow_period": self.parameters["slow_period"],
+                "signal_period": self.parameters["signal_period"],
+            }
+        )
 
     def get_report_reference(self) -> Optional[str]:
         return "MACD技术指标, 用于趋势分析和买卖信号识别"
@@ -245,19 +260,24 @@ class BollingerBandsFactor(Factor):
             self.record_error()
             raise e
 
-    def get_qlib_expression(self) -> str:
+    @cached_property
+    def qlib_expression(self) -> str:
         return (
             f"BBANDS($close, {self.parameters['period']}, {self.parameters['std_dev']})"
         )
 
-    def get_qlib_dependencies(self) -> List[str]:
-        return ["$close"]
-
-    def get_qlib_parameters(self) -> Dict[str, Any]:
-        return {
-            "period": self.parameters["period"],
-            "std_dev": self.parameters["std_dev"],
-        }
+    @property
+    def qlib_dependencies(self) -> Tuple[str, ...]:
+        return QLIB_CLOSE_DEPENDENCIES
+
+    @cached_property
+    def qlib_parameters(self) -> Mapping[str, Any]:
+        return MappingProxyType(
+            {
+                "period": self.parameters["period"],
+                "std_dev": self.parameters["std_dev"],
+            }
+        )
 
     def get_report_reference(self) -> Optional[str]:
         return "Bollinger Bands技术指标, 用于波动性分析和超买超卖判断"
@@ -319,18 +339,23 @@ class KDJFactor(Factor):
             self.record_error()
             raise e
 
-    def get_qlib_expression(self) -> str:
+    @cached_property
+    def qlib_expression(self) -> str:
         return f"STOCH($high, $low, $close, {self.parameters['k_period']}, {self.parameters['d_period']}, {self.parameters['d_period']})"
 
-    def get_qlib_dependencies(self) -> List[str]:
-        return ["$high", "$low", "$close"]
-
-    def get_qlib_parameters(self) -> Dict[str, Any]:
-        return {
-            "k_period": self.parameters["k_period"],
-            "d_period": self.parameters["d_period"],
-            "j_period": self.parameters["j_period"],
-        }
+    @property
+    def qlib_dependencies(self) -> Tuple[str, ...]:
+        return QLIB_HLC_DEPENDENCIES
+
+    @cached_property
+    def qlib_parameters(self) -> Mapping[str, Any]:
+        return MappingProxyType(
+            {
+                "k_period": self.parameters["k_period"],
+                "d_period": self.parameters["d_period"],
+                "j_period": self.parameters["j_period"],
+            }
+        )
 
     def get_report_reference(self) -> Optional[str]:
         return "KDJ随机指标, 用于超买超卖判断和趋势分析"
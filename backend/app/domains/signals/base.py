@@ -3,6 +3,7 @@ Signal pushing channel abstract base class
 """
 
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from enum import Enum
 
 from app.core.logging import get_logger
@@ -26,18 +27,13 @@ class ChannelStatus(str, Enum):
     ERROR = "error"
 
 
+@dataclass(slots=True, frozen=True, repr=False)
 class PushResult:
     """Push result wrapper"""
 
-    def __init__(
-        self,
-        success: bool,
-        message: str = "",
-        error: str | None = None,
-    ):
-        self.success = success
-        self.message = message
-        self.error = error
+    success: bool
+    message: str = ""
+    error: str | None = None
 
     def __repr__(self) -> str:
         return f"PushResult(success={self.success}, message={self.message})"
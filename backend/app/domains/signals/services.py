@@ -2,6 +2,7 @@
 Signal push service
 """
 
+import asyncio
 from typing import Any
 
 from uuid import UUID
@@ -74,6 +75,7 @@ class SignalPushService:
             ]
 
         results = {}
+        known_channels = []
 
         for channel_name in channels:
             if channel_name not in self.channels:
@@ -84,27 +86,39 @@ class SignalPushService:
                 )
                 continue
 
-            channel = self.channels[channel_name]
-
-            try:
-                result = await channel.push(signal_data, recipients)
-                results[channel_name] = result
-
-                if result.success:
-                    logger.info(
-                        f"Signal pushed successfully to {channel_name}: {result.message}"
-                    )
-                else:
-                    logger.error(
-                        f"Failed to push signal to {channel_name}: {result.error}"
-                    )
-
-            except Exception as e:
-                logger.error(f"Error pushing signal to {channel_name}: {str(e)}")
+            # Placeholder keeps the results in the requested channel order
+            results[channel_name] = None
+            known_channels.append(channel_name)
+
+        # Channels deliver independently, so push to them together
+        pushed = await asyncio.gather(
+            *(
+                self.channels[channel_name].push(signal_data, recipients)
+                for channel_name in known_channels
+            ),
+            return_exceptions=True,
+        )
+
+        for channel_name, result in zip(known_channels, pushed, strict=True):
+            # Cancellation and interpreter exits are not push failures
+            if isinstance(result, BaseException) and not isinstance(result, Exception):
+                raise result
+            if isinstance(result, Exception):
+                logger.error(f"Error pushing signal to {channel_name}: {str(result)}")
                 results[channel_name] = PushResult(
                     success=False,
-                    error=str(e),
+                    error=str(result),
+                )
+                continue
+
+            results[channel_name] = result
+
+            if result.success:
+                logger.info(
+                    f"Signal pushed successfully to {channel_name}: {result.message}"
                 )
+            else:
+                logger.error(f"Failed to push signal to {channel_name}: {result.error}")
 
         return results
 
@@ -118,19 +132,32 @@ class SignalPushService:
 
         health_status = {}
 
-        for name, channel in self.channels.items():
-            try:
-                is_healthy = await channel.health_check()
-                health_status[name] = is_healthy
+        # Channels are checked independently, so await them together
+        names = list(self.channels)
+        checks = await asyncio.gather(
+            *(self.channels[name].health_check() for name in names),
+            return_exceptions=True,
+        )
+
+        for name, is_healthy in zip(names, checks, strict=True):
+            # Cancellation and interpreter exits say nothing about the channel
+            if isinstance(is_healthy, BaseException) and not isinstance(
+                is_healthy, Exception
+            ):
+                raise is_healthy
+            if isinstance(is_healthy, Exception):
+                logger.error(
+                    f"Error checking health of channel {name}: {str(is_healthy)}"
+                )
+                health_status[name] = False
+                continue
 
-                if is_healthy:
-                    logger.info(f"Channel {name} is healthy")
-                else:
-                    logger.warning(f"Channel {name} health check failed")
+            health_status[name] = is_healthy
 
-            except Exception as e:
-                logger.error(f"Error checking health of channel {name}: {str(e)}")
-                health_status[name] = False
+            if is_healthy:
+                logger.info(f"Channel {name} is healthy")
+            else:
+                logger.warning(f"Channel {name} health check failed")
 
         return health_status
 
@@ -203,8 +230,8 @@ class SignalPushService:
                 raise ValueError("strategy_name is required")
             
             # 验证策略是否在代码注册表中
-            from app.domains.strategies.services import StrategyService
-            strategy_service = StrategyService()
+            from app.domains.strategies.services import strategy_service
+
             registered_strategies = strategy_service.list_strategies()
             if strategy_name not in registered_strategies:
                 raise ValueError(
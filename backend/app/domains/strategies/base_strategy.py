@@ -38,10 +38,16 @@ class BaseStrategy(bt.Strategy, ABC, metaclass=StrategyMeta):
         self.factor_service: Optional[FactorService] = factor_service
 
         self._data_index_to_group: Dict[int, str] = {}
+        # Feeds never change during a run, so the name -> feed map is built once
+        self._group_data: Optional[Dict[str, bt.feeds.DataBase]] = None
 
         self._db_session = getattr(self.__class__, "_db_session", None)
         self._backtest_id = getattr(self.__class__, "_backtest_id", None)
         self._strategy_name = self.__class__.__name__
+        # Signal rows buffered during the run and bulk-inserted in stop()
+        # Signals are only written to the database when the run reaches
+        # stop(), a run that raises before then persists none of them
+        self._pending_signals: List[Dict[str, Any]] = []
 
     @classmethod
     @abstractmethod
@@ -67,12 +73,11 @@ class BaseStrategy(bt.Strategy, ABC, metaclass=StrategyMeta):
         return self._data_index_to_group.get(data_index)
 
     def _save_signal_to_db(self, signal: Dict[str, Any], current_date: pd.Timestamp):
-        """Save signal to database if backtest context is available"""
+        """Queue signal for the end-of-run bulk insert if backtest context is available"""
         if self._db_session is None or self._backtest_id is None:
             return
 
         try:
-            from app.models import Signal
             from uuid import UUID
             from datetime import datetime
 
@@ -87,33 +92,62 @@ class BaseStrategy(bt.Strategy, ABC, metaclass=StrategyMeta):
             if isinstance(signal_datetime, datetime):
                 signal_datetime = signal_datetime.replace(hour=0, minute=0, second=0, microsecond=0)
 
-            # Create signal record
-            signal_record = Signal(
-                strategy_name=self._strategy_name,
-                symbol=signal.get("symbol", self.symbol),
-                signal_time=signal_datetime,
-                status=signal.get("action", "unknown"),
-                signal_strength=signal.get("confidence", 0.0),
-                price=signal.get("price"),
-                quantity=signal.get("quantity"),
-                message=signal.get("reason", ""),
-                backtest_id=(
-                    UUID(self._backtest_id)
-                    if isinstance(self._backtest_id, str)
-                    else self._backtest_id
-                ),
+            # Plain column values, the Signal column defaults fill id,
+            # push_status and created_at at insert time
+            self._pending_signals.append(
+                {
+                    "strategy_name": self._strategy_name,
+                    "symbol": signal.get("symbol", self.symbol),
+                    "signal_time": signal_datetime,
+                    "status": signal.get("action", "unknown"),
+                    "signal_strength": signal.get("confidence", 0.0),
+                    "price": signal.get("price"),
+                    "quantity": signal.get("quantity"),
+                    "message": signal.get("reason", ""),
+                    "backtest_id": (
+                        UUID(self._backtest_id)
+                        if isinstance(self._backtest_id, str)
+                        else self._backtest_id
+                    ),
+                }
+            )
+            logger.debug(
+                "Queued signal: %s %s at %s",
+                signal.get("action"),
+                signal.get("symbol"),
+                signal_datetime,
             )
 
-            self._db_session.add(signal_record)
+        except Exception as e:
+            logger.error("Failed to queue signal: %s", e)
+
+    def _flush_signals(self):
+        """Bulk-insert queued signals in a single statement"""
+        if not self._pending_signals or self._db_session is None:
+            return
+
+        try:
+            from sqlalchemy import insert
+            from app.models import Signal
+
+            self._db_session.execute(insert(Signal), self._pending_signals)
             self._db_session.commit()
-            logger.debug(
-                f"Saved signal: {signal.get('action')} {signal.get('symbol')} at {signal_datetime}"
+            logger.info(
+                "Saved %s signals for backtest %s",
+                len(self._pending_signals),
+                self._backtest_id,
             )
 
         except Exception as e:
-            logger.error(f"Failed to save signal to database: {e}")
-            if self._db_session:
-                self._db_session.rollback()
+            logger.error("Failed to save signals to database: %s", e)
+            self._db_session.rollback()
+
+        finally:
+            self._pending_signals = []
+
+    def stop(self):
+        """Backtrader's end-of-run hook, the only place queued signals are persisted"""
+        self._flush_signals()
 
     def next(self):
         """
@@ -132,12 +166,13 @@ class BaseStrategy(bt.Strategy, ABC, metaclass=StrategyMeta):
 
         current_date = self.data0.datetime.datetime(0)
 
-        group_data = {}
-        for i, data in enumerate(self.datas):
-            group_name = self._get_group_name(i) or f"data{i}"
-            group_data[group_name] = data
+        if self._group_data is None:
+            self._group_data = {
+                self._get_group_name(i) or f"data{i}": data
+                for i, data in enumerate(self.datas)
+            }
 
-        signals = self._generate_signals(group_data, current_date)
+        signals = self._generate_signals(self._group_data, current_date)
 
         self._execute_trades(signals, current_date)
 
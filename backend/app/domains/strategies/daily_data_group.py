@@ -2,6 +2,7 @@
 DailyDataGroup implementation for daily stock data with OHLCV columns
 """
 
+import asyncio
 import pandas as pd
 import backtrader as bt
 from typing import Dict, Any, List
@@ -10,6 +11,9 @@ from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Shared result for symbols without usable data, never mutated
+_EMPTY_DF = pd.DataFrame()
+
 
 class DailyDataGroup(DataGroup):
     """Data group for daily stock data with OHLCV columns"""
@@ -43,18 +47,22 @@ class DailyDataGroup(DataGroup):
 
             if data.empty:
                 logger.warning(f"Empty data for {symbol}")
-                self._prepared_data = pd.DataFrame()
+                self._prepared_data = _EMPTY_DF
                 return self._prepared_data
 
             if "timestamp" not in data.columns:
                 logger.error(f"timestamp column not found in data for {symbol}")
-                self._prepared_data = pd.DataFrame()
+                self._prepared_data = _EMPTY_DF
                 return self._prepared_data
 
-            data = data.copy()
-            data["timestamp"] = pd.to_datetime(data["timestamp"])
-            data.set_index("timestamp", inplace=True)
-            data.sort_index(inplace=True)
+            # drop() already returns a new frame, so the cached input is left
+            # untouched without a separate full copy
+            index = pd.DatetimeIndex(
+                pd.to_datetime(data["timestamp"]), name="timestamp"
+            )
+            data = data.drop(columns="timestamp").set_axis(index)
+            if not data.index.is_monotonic_increasing:
+                data = data.sort_index()
 
             if self.factors and self.factor_service:
                 data = await self._calculate_factors(data)
@@ -67,7 +75,7 @@ class DailyDataGroup(DataGroup):
 
         except Exception as e:
             logger.error(f"Error preparing data for {self.name}: {e}")
-            self._prepared_data = pd.DataFrame()
+            self._prepared_data = _EMPTY_DF
             raise
 
     def to_backtrader_feed(self) -> bt.feeds.PandasData:
@@ -162,9 +170,23 @@ class DailyDataGroup(DataGroup):
 
         factor_data = data.copy()
         data_with_timestamp = data.reset_index()
-        for factor_name, factor_obj in self._factor_objects.items():
+
+        # Factors are independent of each other, so await them together
+        factor_items = list(self._factor_objects.items())
+        factor_results = await asyncio.gather(
+            *(
+                factor_obj.calculate(data_with_timestamp)
+                for _, factor_obj in factor_items
+            ),
+            return_exceptions=True,
+        )
+
+        for (factor_name, factor_obj), factor_result in zip(
+            factor_items, factor_results, strict=True
+        ):
             try:
-                factor_result = await factor_obj.calculate(data_with_timestamp)
+                if isinstance(factor_result, BaseException):
+                    raise factor_result
 
                 if isinstance(factor_result, pd.DataFrame):
                     factor_col_name = factor_obj.name
@@ -4,16 +4,53 @@ Dual Moving Average Strategy
 A simple strategy that uses two moving averages (short and long) to generate signals
 """
 
-from typing import Dict, Any, List
+from dataclasses import dataclass
+import sys
+from typing import Dict, Any, List, Optional
+import numpy as np
 import pandas as pd
 import backtrader as bt
 
 from app.domains.strategies.base_strategy import BaseStrategy
+from app.core.jit import njit
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+@njit(cache=True)
+def _crossover_kernel(
+    short_prev: float, long_prev: float, short_cur: float, long_cur: float
+) -> int:
+    """
+    Detect a moving average crossover between two consecutive bars
+
+    Returns 1 for a golden cross, -1 for a death cross and 0 otherwise.
+    NaN inputs compare false and therefore never produce a signal. The two
+    cases are mutually exclusive, so they are combined arithmetically rather
+    than branched on, which keeps near-crossover bars free of mispredictions.
+    """
+    golden = (short_prev <= long_prev) & (short_cur > long_cur)
+    death = (short_prev >= long_prev) & (short_cur < long_cur)
+    return int(golden) - int(death)
+
+
+# Indexed by crossover code + 1: death cross, no cross, golden cross
+_CROSS_ACTIONS = (
+    ("sell", "Death cross: MA{short} crossed below MA{long}"),
+    None,
+    ("buy", "Golden cross: MA{short} crossed above MA{long}"),
+)
+
+
+@dataclass(slots=True)
+class _CrossState:
+    """Per-run crossover arrays read on every bar, slotted for cheap access"""
+
+    cross_signals: Optional[np.ndarray] = None
+    missing_factors_logged: bool = False
+
+
 class DualMovingAverageStrategy(BaseStrategy):
     """
     Dual Moving Average implementation
@@ -22,8 +59,48 @@ class DualMovingAverageStrategy(BaseStrategy):
     def __init__(self):
         self.short_period = 5
         self.long_period = 20
+        # Factor column keys looked up every bar, formatted and interned once
+        self._short_ma_name = sys.intern(f"MA_{self.short_period}_SMA")
+        self._long_ma_name = sys.intern(f"MA_{self.long_period}_SMA")
+        self._state = _CrossState()
         super().__init__()
 
+    @classmethod
+    def precompute(cls, short_ma: np.ndarray, long_ma: np.ndarray) -> np.ndarray:
+        """
+        Compute crossover codes for every bar in one vectorized pass
+
+        Returns an int8 array aligned with the inputs holding 1 for a golden
+        cross, -1 for a death cross and 0 otherwise. Bars with NaN averages
+        never signal, matching _crossover_kernel.
+        """
+        signals = np.zeros(len(short_ma), dtype=np.int8)
+        if len(short_ma) < 2:
+            return signals
+
+        short_prev, long_prev = short_ma[:-1], long_ma[:-1]
+        short_cur, long_cur = short_ma[1:], long_ma[1:]
+        with np.errstate(invalid="ignore"):
+            golden = (short_prev <= long_prev) & (short_cur > long_cur)
+            death = (short_prev >= long_prev) & (short_cur < long_cur)
+        signals[1:] = np.where(golden, 1, np.where(death, -1, 0))
+        return signals
+
+    def _precompute_from_feed(
+        self, daily_data: bt.feeds.DataBase, short_ma_name: str, long_ma_name: str
+    ) -> Optional[np.ndarray]:
+        """Precompute crossover codes from the DataFrame backing a preloaded feed"""
+        frame = getattr(daily_data.p, "dataname", None)
+        if not isinstance(frame, pd.DataFrame):
+            return None
+        if short_ma_name not in frame.columns or long_ma_name not in frame.columns:
+            return None
+
+        return self.precompute(
+            frame[short_ma_name].to_numpy(dtype=np.float64),
+            frame[long_ma_name].to_numpy(dtype=np.float64),
+        )
+
     @classmethod
     def get_data_group_configs(cls) -> List[Dict[str, Any]]:
         """Get data group configurations without instantiating the strategy"""
@@ -52,6 +129,7 @@ class DualMovingAverageStrategy(BaseStrategy):
     ) -> List[Dict[str, Any]]:
         """Generate trading signals based on MA crossovers"""
         signals = []
+        state = self._state
         daily_data = group_data.get("daily")
 
         if daily_data is None:
@@ -60,10 +138,8 @@ class DualMovingAverageStrategy(BaseStrategy):
         if len(daily_data) < self.long_period:
             return signals
 
-        current_price = daily_data.close[0]
-
-        short_ma_name = f"MA_{self.short_period}_SMA"
-        long_ma_name = f"MA_{self.long_period}_SMA"
+        short_ma_name = self._short_ma_name
+        long_ma_name = self._long_ma_name
 
         try:
             short_ma_value = None
@@ -78,54 +154,72 @@ class DualMovingAverageStrategy(BaseStrategy):
                 if long_ma_idx is not None:
                     long_ma_value = daily_data.lines[long_ma_idx]
 
+            if len(daily_data) <= self.long_period:
+                return signals
+
+            # Preloaded feeds map bar N to row N of the backing frame
+            bar_index = len(daily_data) - 1
+
             if short_ma_value is not None and long_ma_value is not None:
                 short_ma_current = short_ma_value[0]
                 long_ma_current = long_ma_value[0]
 
-                if len(daily_data) > self.long_period:
-                    short_ma_prev = short_ma_value[-1]
-                    long_ma_prev = long_ma_value[-1]
-
-                    if (
-                        short_ma_prev <= long_ma_prev
-                        and short_ma_current > long_ma_current
-                    ):
-
-                        ma_distance = abs(short_ma_current - long_ma_current)
-
-                        confidence = min(ma_distance / long_ma_current, 1.0)
+                if state.cross_signals is None:
+                    state.cross_signals = self._precompute_from_feed(
+                        daily_data, short_ma_name, long_ma_name
+                    )
 
-                        signals.append(
-                            {
-                                "action": "buy",
-                                "symbol": self.symbol,
-                                "price": current_price,
-                                "confidence": confidence,
-                                "reason": f"Golden cross: MA{self.short_period} crossed above MA{self.long_period}",
-                            }
-                        )
+                # Anything that is not a preloaded frame falls back to the
+                # per-bar kernel
+                if (
+                    state.cross_signals is not None
+                    and bar_index < len(state.cross_signals)
+                ):
+                    cross = int(state.cross_signals[bar_index])
+                else:
+                    cross = _crossover_kernel(
+                        float(short_ma_value[-1]),
+                        float(long_ma_value[-1]),
+                        float(short_ma_current),
+                        float(long_ma_current),
+                    )
+            else:
+                # Factor calculation failed upstream, so there is nothing to
+                # trade on for this run
+                if not state.missing_factors_logged:
+                    logger.warning(
+                        "MA factor columns %s/%s missing, no signals generated",
+                        short_ma_name,
+                        long_ma_name,
+                    )
+                    state.missing_factors_logged = True
+                return signals
 
-                    elif (
-                        short_ma_prev >= long_ma_prev
-                        and short_ma_current < long_ma_current
-                    ):
+            # Most bars do not cross, so the close is only read when a signal
+            # is actually emitted
+            if cross != 0:
+                current_price = daily_data.close[0]
+                ma_distance = abs(short_ma_current - long_ma_current)
 
-                        ma_distance = abs(short_ma_current - long_ma_current)
+                confidence = min(ma_distance / long_ma_current, 1.0)
 
-                        confidence = min(ma_distance / long_ma_current, 1.0)
+                action, reason_template = _CROSS_ACTIONS[cross + 1]
+                reason = reason_template.format(
+                    short=self.short_period, long=self.long_period
+                )
 
-                        signals.append(
-                            {
-                                "action": "sell",
-                                "symbol": self.symbol,
-                                "price": current_price,
-                                "confidence": confidence,
-                                "reason": f"Death cross: MA{self.short_period} crossed below MA{self.long_period}",
-                            }
-                        )
+                signals.append(
+                    {
+                        "action": action,
+                        "symbol": self.symbol,
+                        "price": current_price,
+                        "confidence": confidence,
+                        "reason": reason,
+                    }
+                )
 
         except Exception as e:
-            logger.warning(f"Error accessing factor columns: {e}")
+            logger.warning("Error accessing factor columns: %s", e)
 
         return signals
 
@@ -144,7 +238,11 @@ class DualMovingAverageStrategy(BaseStrategy):
                     if size > 0:
                         self.buy(size=size)
                         logger.info(
-                            f"Buy order: {size} shares of {symbol} at {price:.2f} on {current_date}"
+                            "Buy order: %s shares of %s at %.2f on %s",
+                            size,
+                            symbol,
+                            price,
+                            current_date,
                         )
 
                         # Save signal to database
@@ -158,7 +256,10 @@ class DualMovingAverageStrategy(BaseStrategy):
                 if self.position:
                     self.close()
                     logger.info(
-                        f"Sell order: close position of {symbol} at {price:.2f} on {current_date}"
+                        "Sell order: close position of %s at %.2f on %s",
+                        symbol,
+                        price,
+                        current_date,
                     )
 
                     # Save signal to database
@@ -4,6 +4,7 @@ Strategy service for managing and running strategies
 
 import importlib
 import inspect
+import pkgutil
 from typing import Dict, Any, Optional, Type, List
 import backtrader as bt
 import asyncio
@@ -31,6 +32,9 @@ from app.core.config import settings
 
 logger = get_logger(__name__)
 
+# Decimal places kept for floats persisted in BacktestResult.result_data
+RESULT_FLOAT_DIGITS = 8
+
 
 _DATA_GROUP_REGISTRY: Dict[str, Type[DataGroup]] = {}
 
@@ -63,13 +67,13 @@ def create_data_group_from_config(config: Dict[str, Any]) -> DataGroup:
         register_data_group_type("DailyDataGroup", DailyDataGroup)
 
     group_type = config.get("type")
-    if group_type not in _DATA_GROUP_REGISTRY:
+    group_class = _DATA_GROUP_REGISTRY.get(group_type)
+    if group_class is None:
         raise ValueError(
             f"Unsupported DataGroup type: {group_type}. "
-            f"Available types: {list(_DATA_GROUP_REGISTRY.keys())}"
+            f"Available types: {list(_DATA_GROUP_REGISTRY)}"
         )
 
-    group_class = _DATA_GROUP_REGISTRY[group_type]
     return group_class(
         name=config["name"],
         weight=config.get("weight", 1.0),
@@ -77,61 +81,58 @@ def create_data_group_from_config(config: Dict[str, Any]) -> DataGroup:
     )
 
 
+def _discover_strategies() -> Dict[str, Type[BaseStrategy]]:
+    """Find strategy classes in the *_strategy modules of app.domains.strategies"""
+    discovered: Dict[str, Type[BaseStrategy]] = {}
+    try:
+        strategies_package = importlib.import_module("app.domains.strategies")
+        modnames = sorted(
+            info.name
+            for info in pkgutil.iter_modules(strategies_package.__path__)
+            if info.name.endswith("_strategy")
+            and info.name != "base_strategy"
+            and not info.ispkg
+        )
+
+        for modname in modnames:
+            module_name = f"{strategies_package.__name__}.{modname}"
+            try:
+                module = importlib.import_module(module_name)
+
+                for name, obj in inspect.getmembers(module, inspect.isclass):
+                    if (
+                        issubclass(obj, BaseStrategy)
+                        and obj is not BaseStrategy
+                        and obj.__module__ == module_name
+                    ):
+                        discovered[name] = obj
+                        logger.info(
+                            f"Auto-discovered strategy: {name} from {module_name}"
+                        )
+            except Exception as e:
+                logger.warning(f"Failed to import or scan module {module_name}: {e}")
+                continue
+    except Exception as e:
+        logger.error(f"Error auto-discovering strategies: {e}")
+
+    return discovered
+
+
+# Strategy modules are scanned once at import; each StrategyService copies this
+_DISCOVERED_STRATEGIES = _discover_strategies()
+
+
 class StrategyService:
     """
     Manages strategy discovery, registration, and execution (backtest, paper, live)
     """
 
     def __init__(self):
-        self.strategies: Dict[str, Type[BaseStrategy]] = {}
+        self.strategies: Dict[str, Type[BaseStrategy]] = dict(_DISCOVERED_STRATEGIES)
         self.data_service = data_service
         self.factor_service = factor_service
-        self._auto_discover_strategies()
-
-    def _auto_discover_strategies(self):
-        """Auto-discover strategy classes by scanning Python files in app.domains.strategies package"""
-        try:
-            import pkgutil
-            from pathlib import Path
-
-            # Get the package path
-            strategies_package = importlib.import_module("app.domains.strategies")
-            package_path = Path(strategies_package.__file__).parent
-
-            for importer, modname, ispkg in pkgutil.iter_modules([str(package_path)]):
-                if ispkg:
-                    continue
-
-                if modname in [
-                    "base_strategy",
-                    "data_group",
-                    "daily_data_group",
-                    "enums",
-                    "services",
-                ]:
-                    continue
-
-                try:
-                    module_name = f"app.domains.strategies.{modname}"
-                    module = importlib.import_module(module_name)
-
-                    for name, obj in inspect.getmembers(module, inspect.isclass):
-                        if (
-                            issubclass(obj, BaseStrategy)
-                            and obj is not BaseStrategy
-                            and obj.__module__ == module_name
-                        ):
-                            self.register_strategy(name, obj)
-                            logger.info(
-                                f"Auto-discovered strategy: {name} from {module_name}"
-                            )
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to import or scan module {module_name}: {e}"
-                    )
-                    continue
-        except Exception as e:
-            logger.error(f"Error auto-discovering strategies: {e}")
+        # Name list cached until the next register/unregister
+        self._list_cache: Optional[List[str]] = None
 
     def register_strategy(self, name: str, strategy_class: Type[BaseStrategy]):
         """Register a strategy class"""
@@ -139,16 +140,35 @@ class StrategyService:
             raise ValueError(f"{strategy_class} is not a subclass of BaseStrategy")
 
         self.strategies[name] = strategy_class
+        self._list_cache = None
         logger.info(f"Registered strategy: {name}")
 
+    def unregister_strategy(self, name: str) -> bool:
+        """Remove a registered strategy class"""
+        if name not in self.strategies:
+            return False
+
+        del self.strategies[name]
+        self._list_cache = None
+        return True
+
     def list_strategies(self) -> List[str]:
-        """List all registered strategy names"""
-        return list(self.strategies.keys())
+        """List all registered strategy names, the returned list is shared and must not be mutated"""
+        if self._list_cache is None:
+            self._list_cache = list(self.strategies.keys())
+        return self._list_cache
 
     def get_strategy(self, name: str) -> Optional[Type[BaseStrategy]]:
         """Get a strategy class by name"""
         return self.strategies.get(name)
 
+    def _require_strategy(self, name: str) -> Type[BaseStrategy]:
+        """Get a strategy class by name, raising ValueError when it is unknown"""
+        strategy_class = self.get_strategy(name)
+        if not strategy_class:
+            raise ValueError(f"Strategy {name} not found")
+        return strategy_class
+
     async def run_backtest(
         self,
         session: Session,
@@ -174,9 +194,7 @@ class StrategyService:
         if mode is None:
             mode = TradingMode.BACKTEST
 
-        strategy_class = self.get_strategy(strategy_name)
-        if not strategy_class:
-            raise ValueError(f"Strategy {strategy_name} not found")
+        strategy_class = self._require_strategy(strategy_name)
 
         logger.info(f"Starting backtest for {strategy_name} with symbol {symbol}")
 
@@ -194,9 +212,11 @@ class StrategyService:
 
         data_group_configs = strategy_class.get_data_group_configs()
 
+        groups = []
         feeds = []
         for config in data_group_configs:
             group = create_data_group_from_config(config)
+            groups.append(group)
             group.set_service(self.data_service, self.factor_service)
             await group.prepare_data(
                 symbol=symbol, start_date=start_date, end_date=end_date
@@ -288,14 +308,14 @@ class StrategyService:
         cerebro.broker.addcommissioninfo(comminfo)
 
         # Extract data_type from the first DataGroup that has OHLCV data
+        # Reuse the groups built above instead of constructing them again
         data_type = "daily"
-        if data_group_configs:
-            for config in data_group_configs:
-                temp_group = create_data_group_from_config(config)
-                if hasattr(temp_group, "data_type"):
-                    data_type = temp_group.data_type
+        if groups:
+            for group in groups:
+                if hasattr(group, "data_type"):
+                    data_type = group.data_type
                     logger.info(
-                        f"Found data_type '{data_type}' from DataGroup '{temp_group.name}'"
+                        f"Found data_type '{data_type}' from DataGroup '{group.name}'"
                     )
                     break
 
@@ -323,8 +343,8 @@ class StrategyService:
         logger.info(f"Created backtest record with ID: {backtest_id}, status: running")
 
         try:
-            loop = asyncio.get_running_loop()
-            result_list = await loop.run_in_executor(None, cerebro.run)
+            # cerebro.run is blocking and CPU-bound, keep it off the event loop
+            result_list = await asyncio.to_thread(cerebro.run)
 
             if not result_list:
                 raise ValueError(
@@ -345,7 +365,7 @@ class StrategyService:
                     fig.savefig(chart_path, dpi=100, bbox_inches="tight")
                     plt.close(fig)
 
-                await loop.run_in_executor(None, save_chart)
+                await asyncio.to_thread(save_chart)
                 logger.info(f"Backtest chart saved to {chart_path}")
             except Exception as chart_error:
                 logger.warning(
@@ -466,19 +486,23 @@ class StrategyService:
                 calmar_data = analyzers.calmar.get_analysis()
                 logger.info(f"Calmar data: {calmar_data}")
                 # Calmar analyzer returns dict with dates as keys and calmar values
-                # Get the last (most recent) non-NaN value
-                calmar_values = [
-                    v
-                    for v in calmar_data.values()
-                    if v is not None
-                    and not (isinstance(v, float) and v != v)
-                    and v != 0.0
-                ]  # Filter out None, NaN, and 0.0
+                # Get the last (most recent) non-NaN value, scanning from the end
+                # so the per-date series is never copied into a list
+                last_calmar = next(
+                    (
+                        v
+                        for v in reversed(calmar_data.values())
+                        if v is not None
+                        and not (isinstance(v, float) and v != v)
+                        and v != 0.0
+                    ),
+                    None,
+                )  # Skip None, NaN, and 0.0
 
                 # Try to use analyzer value if valid
                 calmar_from_analyzer = None
-                if calmar_values:
-                    calmar_from_analyzer = calmar_values[-1]
+                if last_calmar is not None:
+                    calmar_from_analyzer = last_calmar
                     # Check if the value is reasonable (absolute value > 0.001)
                     if abs(calmar_from_analyzer) > 0.001:
                         performance["calmar_ratio"] = calmar_from_analyzer
@@ -578,7 +602,9 @@ class StrategyService:
             backtest_result.status = "completed"
 
             # Store performance data in result_data field
-            # Convert datetime objects to strings for JSON serialization
+            # Convert datetime objects to strings for JSON serialization and
+            # quantize floats, digits past RESULT_FLOAT_DIGITS are analyzer noise
+            # that only inflates the per-date series in the stored blob
             def convert_datetime_to_str(obj):
                 """Recursively convert datetime objects to ISO format strings"""
                 from datetime import date
@@ -587,6 +613,8 @@ class StrategyService:
                     return obj.strftime("%Y-%m-%d")
                 elif isinstance(obj, date):
                     return obj.strftime("%Y-%m-%d")
+                elif isinstance(obj, float):
+                    return round(obj, RESULT_FLOAT_DIGITS)
                 elif isinstance(obj, dict):
                     return {
                         convert_datetime_to_str(k): convert_datetime_to_str(v)
@@ -599,7 +627,7 @@ class StrategyService:
 
             performance_serializable = convert_datetime_to_str(performance)
             backtest_result.result_data = json.dumps(
-                {"performance": performance_serializable}
+                {"performance": performance_serializable}, separators=(",", ":")
             )
 
             session.commit()
@@ -624,3 +652,6 @@ class StrategyService:
                 exc_info=True,
             )
             raise
+
+
+strategy_service = StrategyService()
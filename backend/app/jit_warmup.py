@@ -0,0 +1,28 @@
+import logging
+
+from app.core.jit import NUMBA_AVAILABLE
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def init() -> None:
+    # Same argument types the strategies use, so the cached signatures match
+    from app.domains.strategies.dual_moving_average_strategy import (
+        _crossover_kernel,
+    )
+
+    _crossover_kernel(0.0, 0.0, 0.0, 0.0)
+
+
+def main() -> None:
+    if not NUMBA_AVAILABLE:
+        logger.info("Numba not installed, skipping JIT warm-up")
+        return
+    logger.info("Compiling JIT kernels")
+    init()
+    logger.info("JIT kernels compiled and cached")
+
+
+if __name__ == "__main__":
+    main()
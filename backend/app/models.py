@@ -6,9 +6,14 @@ from datetime import datetime
 from typing import List, Optional
 from uuid import UUID, uuid4
 from sqlalchemy import Index
+from sqlalchemy.dialects.postgresql import JSONB
 import sqlalchemy as sa
 
 
+# JSON documents are stored as JSONB on PostgreSQL and plain JSON elsewhere
+JSONType = sa.JSON().with_variant(JSONB(), "postgresql")
+
+
 # Shared properties
 class UserBase(SQLModel):
     email: EmailStr = Field(unique=True, index=True, max_length=255)
@@ -131,9 +136,15 @@ class Strategy(SQLModel, table=True):
     description: Optional[str] = Field(default=None, max_length=500)
     strategy_type: str = Field(max_length=50)
     status: str = Field(default="draft", max_length=20)
-    config: Optional[str] = Field(default=None)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    config: Optional[dict] = Field(default=None, sa_type=JSONType)
+    created_at: datetime = Field(
+        default_factory=datetime.utcnow,
+        sa_column_kwargs={"server_default": sa.func.now()},
+    )
+    updated_at: datetime = Field(
+        default_factory=datetime.utcnow,
+        sa_column_kwargs={"server_default": sa.func.now(), "onupdate": sa.func.now()},
+    )
     created_by: UUID = Field(foreign_key="user.id")
 
     creator: Optional["User"] = Relationship(back_populates="strategies")
@@ -150,8 +161,14 @@ class Factor(SQLModel, table=True):
     formula: str = Field(max_length=1000)
     parameters: Optional[str] = Field(default=None)
     status: str = Field(default="active", max_length=20)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(
+        default_factory=datetime.utcnow,
+        sa_column_kwargs={"server_default": sa.func.now()},
+    )
+    updated_at: datetime = Field(
+        default_factory=datetime.utcnow,
+        sa_column_kwargs={"server_default": sa.func.now(), "onupdate": sa.func.now()},
+    )
     created_by: UUID = Field(foreign_key="user.id")
 
     creator: Optional["User"] = Relationship(back_populates="factors")
@@ -159,6 +176,10 @@ class Factor(SQLModel, table=True):
 
 class Backtest(SQLModel, table=True):
     __tablename__ = "backtests"
+    __table_args__ = (
+        # Metric filters such as results->'sharpe' without a table scan
+        Index("ix_backtests_results_gin", "results", postgresql_using="gin"),
+    )
 
     id: Optional[UUID] = Field(
         default_factory=uuid4,
@@ -170,10 +191,16 @@ class Backtest(SQLModel, table=True):
     end_date: datetime = Field(index=True)
     initial_capital: float = Field(default=1000000.0)
     status: str = Field(default="pending", max_length=20)
-    results: Optional[str] = Field(default=None)
-    performance_metrics: Optional[str] = Field(default=None)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    results: Optional[dict] = Field(default=None, sa_type=JSONType)
+    performance_metrics: Optional[dict] = Field(default=None, sa_type=JSONType)
+    created_at: datetime = Field(
+        default_factory=datetime.utcnow,
+        sa_column_kwargs={"server_default": sa.func.now()},
+    )
+    updated_at: datetime = Field(
+        default_factory=datetime.utcnow,
+        sa_column_kwargs={"server_default": sa.func.now(), "onupdate": sa.func.now()},
+    )
     created_by: UUID = Field(foreign_key="user.id")
 
     strategy: Optional["Strategy"] = Relationship(back_populates="backtests")
@@ -182,6 +209,14 @@ class Backtest(SQLModel, table=True):
 
 class Signal(SQLModel, table=True):
     __tablename__ = "signals"
+    __table_args__ = (
+        # Latest signals for a strategy
+        Index("ix_signals_strategy_created", "strategy_name", "created_at"),
+        # Pending pushes in creation order
+        Index("ix_signals_push_created", "push_status", "created_at"),
+        # Signals of one backtest in time order
+        Index("ix_signals_backtest_signal_time", "backtest_id", "signal_time"),
+    )
 
     id: Optional[UUID] = Field(default_factory=uuid4, primary_key=True)
     strategy_name: Optional[str] = Field(default=None, max_length=100, index=True)
@@ -192,11 +227,14 @@ class Signal(SQLModel, table=True):
     message: Optional[str] = Field(default=None, max_length=500)
     status: str = Field(default="pending", max_length=20)
     push_status: str = Field(default="not_pushed", max_length=20, index=True)
-    push_channels: Optional[str] = Field(default=None, max_length=200)
+    push_channels: Optional[list] = Field(default=None, sa_type=JSONType)
     push_time: Optional[datetime] = Field(default=None)
     push_error: Optional[str] = Field(default=None, max_length=500)
     sent_at: Optional[datetime] = Field(default=None)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(
+        default_factory=datetime.utcnow,
+        sa_column_kwargs={"server_default": sa.func.now()},
+    )
     created_by: Optional[UUID] = Field(default=None, foreign_key="user.id")
     # 信号生成时间（精确时间戳）
     signal_time: datetime = Field(
@@ -247,4 +285,7 @@ class BacktestResult(SQLModel, table=True):
     status: str = Field(default="pending", max_length=20)
     result_data: str = Field(default="{}")
     created_by: str = Field(max_length=100)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(
+        default_factory=datetime.utcnow,
+        sa_column_kwargs={"server_default": sa.func.now()},
+    )
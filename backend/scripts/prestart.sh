@@ -11,3 +11,6 @@ alembic upgrade head
 
 # Create initial data in DB
 python app/initial_data.py
+
+# Compile Numba kernels into the on-disk cache before serving requests
+python app/jit_warmup.py
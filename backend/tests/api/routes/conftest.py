@@ -0,0 +1,71 @@
+from collections.abc import Generator
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
+
+from app.api.deps import get_current_user, get_db
+from app.core.config import settings
+from app.main import app
+from app.models import User
+from tests.utils.backtest import PAGED_COUNT, PAGED_STRATEGY, make_backtest_result
+from tests.utils.utils import override_dep
+
+
+@pytest.fixture(autouse=True)
+def _rollback(db: Session) -> Generator[None, None, None]:
+    # Route tests share the session-wide app, client and db. Rolling back
+    # after each test keeps a failed test's pending state out of the next one
+    # without recreating any of them.
+    yield
+    db.rollback()
+
+
+@pytest.fixture(autouse=True)
+def _no_leaked_overrides() -> Generator[None, None, None]:
+    yield
+    assert app.dependency_overrides == {}, "test left dependency overrides behind"
+
+
+@pytest.fixture(scope="module")
+def seeded_session() -> Generator[Session, None, None]:
+    """In-memory SQLite session seeded with backtest results"""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        session.add(make_backtest_result())
+        session.add_all(
+            make_backtest_result(strategy_name=PAGED_STRATEGY)
+            for _ in range(PAGED_COUNT)
+        )
+        session.commit()
+        yield session
+
+    engine.dispose()
+
+
+@pytest.fixture
+def client_with_db(
+    client: TestClient, seeded_session: Session
+) -> Generator[TestClient, None, None]:
+    """The shared client with routes reading and writing the seeded session"""
+
+    def _get_db() -> Generator[Session, None, None]:
+        yield seeded_session
+
+    # Auth would otherwise look the token's user up in the SQLite database
+    def _get_current_user() -> User:
+        return User(
+            email=settings.FIRST_SUPERUSER, hashed_password="", is_superuser=True
+        )
+
+    with override_dep(get_db, _get_db), override_dep(
+        get_current_user, _get_current_user
+    ):
+        yield client
@@ -149,6 +149,21 @@ def test_compare_backtests_invalid_id_format(
     assert "Invalid backtest ID" in content["detail"]
 
 
+def test_compare_backtests_id_with_trailing_newline(
+    client: TestClient, superuser_token_headers: Dict[str, str]
+):
+    """Test an otherwise valid ID followed by a newline is rejected as invalid"""
+    response = client.post(
+        "/api/v1/backtests/compare",
+        json=[f"{uuid4()}\n", str(uuid4())],
+        headers=superuser_token_headers,
+    )
+
+    assert response.status_code == 400
+    content = response.json()
+    assert "Invalid backtest ID" in content["detail"]
+
+
 def test_compare_backtests_unauthorized(client: TestClient):
     """Test backtest comparison without authentication"""
     response = client.post(
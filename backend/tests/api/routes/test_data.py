@@ -8,27 +8,43 @@ from unittest.mock import AsyncMock, patch
 import pandas as pd
 
 
+# Route handlers only read these frames, so one instance per module is enough
+_MOCK_STOCK_DF = pd.DataFrame(
+    {
+        "timestamp": ["2022-01-01", "2022-01-02"],
+        "open": [10.0, 11.0],
+        "close": [10.5, 11.5],
+        "high": [10.8, 11.8],
+        "low": [10.2, 11.2],
+        "volume": [1000, 1100],
+    }
+)
+
+_MOCK_MACRO_DF = pd.DataFrame(
+    {
+        "timestamp": ["2022-01-01", "2022-02-01"],
+        "value": [100.5, 101.2],
+    }
+)
+
+_MOCK_IC_DF = pd.DataFrame(
+    {
+        "code": ["001", "002"],
+        "name": ["Industry1", "Industry2"],
+    }
+)
+
+
 def test_fetch_stock_data_daily(
     client: AsyncClient, superuser_token_headers: dict[str, str]
 ) -> None:
     """
     Test fetching daily stock data
     """
-    mock_df = pd.DataFrame(
-        {
-            "timestamp": ["2022-01-01", "2022-01-02"],
-            "open": [10.0, 11.0],
-            "close": [10.5, 11.5],
-            "high": [10.8, 11.8],
-            "low": [10.2, 11.2],
-            "volume": [1000, 1100],
-        }
-    )
-
     with patch(
         "app.api.routes.data.data_service.fetch_data", new_callable=AsyncMock
     ) as mock_fetch:
-        mock_fetch.return_value = mock_df
+        mock_fetch.return_value = _MOCK_STOCK_DF
 
         response = client.post(
             "/api/v1/data/stock",
@@ -55,17 +71,10 @@ def test_fetch_macro_data(
     """
     Test fetching macro economic data
     """
-    mock_df = pd.DataFrame(
-        {
-            "timestamp": ["2022-01-01", "2022-02-01"],
-            "value": [100.5, 101.2],
-        }
-    )
-
     with patch(
         "app.api.routes.data.data_service.fetch_data", new_callable=AsyncMock
     ) as mock_fetch:
-        mock_fetch.return_value = mock_df
+        mock_fetch.return_value = _MOCK_MACRO_DF
 
         response = client.post(
             "/api/v1/data/macro",
@@ -91,17 +100,10 @@ def test_fetch_industry_concept_data(
     """
     Test fetching industry or concept data
     """
-    mock_df = pd.DataFrame(
-        {
-            "code": ["001", "002"],
-            "name": ["Industry1", "Industry2"],
-        }
-    )
-
     with patch(
         "app.api.routes.data.data_service.fetch_data", new_callable=AsyncMock
     ) as mock_fetch:
-        mock_fetch.return_value = mock_df
+        mock_fetch.return_value = _MOCK_IC_DF
 
         response = client.post(
             "/api/v1/data/industry-concept",
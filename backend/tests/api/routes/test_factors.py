@@ -3,11 +3,35 @@ Factor management API tests
 """
 
 import pytest
+import json
 from fastapi.testclient import TestClient
+from pydantic import ValidationError
+from app.api.routes.factors import FactorCalculateRequest, FactorRegisterRequest
 from app.main import app
 from tests.utils.utils import get_superuser_token_headers
 
 
+# Request bodies are only read, so they are built once per module
+_RSI_REQUEST = {
+    "factor_name": "rsi",
+    "data_type": "daily",
+    "symbol": "000001.SZ",
+    "start_date": "2023-01-01",
+    "end_date": "2023-01-31",
+    "parameters": {"period": 14, "overbought": 70, "oversold": 30},
+}
+
+_REGISTER_RSI_REQUEST = {
+    "name": "test_rsi",
+    "factor_type": "technical",
+    "description": "Relative Strength Index test factor",
+    "parameters": {"period": 14, "overbought": 70, "oversold": 30},
+    "required_fields": ["close"],
+}
+_REGISTER_RSI_BODY = json.dumps(_REGISTER_RSI_REQUEST).encode()
+_JSON_CONTENT_TYPE = {"content-type": "application/json"}
+
+
 def test_list_factors_success(
     client: TestClient, superuser_token_headers: dict[str, str]
 ):
@@ -23,237 +47,129 @@ def test_list_factors_success(
     assert len(content) == 0
 
 
-def test_get_factor_success(
-    client: TestClient, superuser_token_headers: dict[str, str]
-):
-    """Test successful factor retrieval"""
-    response = client.get(
-        "/api/v1/factors/rsi",
-        headers=superuser_token_headers,
-    )
-
-    assert response.status_code == 404
-    content = response.json()
-    assert "detail" in content
-    assert "Factor 'rsi' not found" in content["detail"]
-
-
-def test_get_factor_not_found(
-    client: TestClient, superuser_token_headers: dict[str, str]
-):
-    """Test factor not found error"""
-    response = client.get(
-        "/api/v1/factors/nonexistent_factor",
-        headers=superuser_token_headers,
-    )
-
-    assert response.status_code == 404
-    content = response.json()
-    assert "detail" in content
-    assert "Factor 'nonexistent_factor' not found" in content["detail"]
-
-
-def test_calculate_factor_not_found(
-    client: TestClient, superuser_token_headers: dict[str, str]
-):
-    """Test factor calculation with non-existent factor"""
-    request_data = {
-        "factor_name": "nonexistent_factor",
-        "data_type": "daily",
-        "symbol": "000001.SZ",
-        "start_date": "2023-01-01",
-        "end_date": "2023-12-31",
-    }
-
-    response = client.post(
-        "/api/v1/factors/calculate", json=request_data, headers=superuser_token_headers
-    )
-
-    assert response.status_code == 404
-    content = response.json()
-    assert "detail" in content
-    assert "Factor 'nonexistent_factor' not found" in content["detail"]
-
-
-def test_calculate_factor_missing_symbol(
-    client: TestClient, superuser_token_headers: dict[str, str]
-):
-    """Test factor calculation with missing symbol for daily data"""
-    request_data = {
-        "factor_name": "rsi",
-        "data_type": "daily",
-        "start_date": "2023-01-01",
-        "end_date": "2023-12-31",
-    }
-
-    response = client.post(
-        "/api/v1/factors/calculate", json=request_data, headers=superuser_token_headers
-    )
-
-    assert response.status_code == 404
-    content = response.json()
-    assert "detail" in content
-    assert "Factor 'rsi' not found" in content["detail"]
-
-
-def test_calculate_factor_missing_indicator(
-    client: TestClient, superuser_token_headers: dict[str, str]
-):
-    """Test factor calculation with missing indicator for macro data"""
-    request_data = {
-        "factor_name": "gdp_growth",
-        "data_type": "macro",
-        "start_date": "2023-01-01",
-        "end_date": "2023-12-31",
-    }
-
-    response = client.post(
-        "/api/v1/factors/calculate", json=request_data, headers=superuser_token_headers
-    )
-
-    assert response.status_code == 404
-    content = response.json()
-    assert "detail" in content
-    assert "Factor 'gdp_growth' not found" in content["detail"]
-
-
-def test_calculate_factor_unsupported_data_type(
-    client: TestClient, superuser_token_headers: dict[str, str]
-):
-    """Test factor calculation with unsupported data type"""
-    request_data = {
-        "factor_name": "rsi",
-        "data_type": "unsupported_type",
-        "symbol": "000001.SZ",
-        "start_date": "2023-01-01",
-        "end_date": "2023-12-31",
-    }
-
-    response = client.post(
-        "/api/v1/factors/calculate", json=request_data, headers=superuser_token_headers
-    )
-
-    assert response.status_code == 404
-    content = response.json()
-    assert "detail" in content
-    assert "Factor 'rsi' not found" in content["detail"]
-
-
-def test_calculate_factor_daily_with_params(
-    client: TestClient, superuser_token_headers: dict[str, str]
-):
-    """Test factor calculation with parameters for daily data"""
-    request_data = {
-        "factor_name": "rsi",
-        "data_type": "daily",
-        "symbol": "000001.SZ",
-        "start_date": "2023-01-01",
-        "end_date": "2023-01-31",
-        "parameters": {"period": 14, "overbought": 70, "oversold": 30},
-    }
-
-    response = client.post(
-        "/api/v1/factors/calculate",
-        json=request_data,
-        headers=superuser_token_headers,
+@pytest.mark.parametrize(
+    "method,url,payload,expected_name",
+    [
+        ("GET", "/api/v1/factors/rsi", None, "rsi"),
+        ("GET", "/api/v1/factors/nonexistent_factor", None, "nonexistent_factor"),
+        ("GET", "/api/v1/factors/rsi/status", None, "rsi"),
+        (
+            "GET",
+            "/api/v1/factors/nonexistent_factor/status",
+            None,
+            "nonexistent_factor",
+        ),
+        ("DELETE", "/api/v1/factors/rsi", None, "rsi"),
+        ("DELETE", "/api/v1/factors/nonexistent_factor", None, "nonexistent_factor"),
+        (
+            "POST",
+            "/api/v1/factors/calculate",
+            {
+                "factor_name": "nonexistent_factor",
+                "data_type": "daily",
+                "symbol": "000001.SZ",
+                "start_date": "2023-01-01",
+                "end_date": "2023-12-31",
+            },
+            "nonexistent_factor",
+        ),
+        # Missing symbol for daily data
+        (
+            "POST",
+            "/api/v1/factors/calculate",
+            {
+                "factor_name": "rsi",
+                "data_type": "daily",
+                "start_date": "2023-01-01",
+                "end_date": "2023-12-31",
+            },
+            "rsi",
+        ),
+        # Missing indicator for macro data
+        (
+            "POST",
+            "/api/v1/factors/calculate",
+            {
+                "factor_name": "gdp_growth",
+                "data_type": "macro",
+                "start_date": "2023-01-01",
+                "end_date": "2023-12-31",
+            },
+            "gdp_growth",
+        ),
+        # Unsupported data type
+        (
+            "POST",
+            "/api/v1/factors/calculate",
+            {
+                "factor_name": "rsi",
+                "data_type": "unsupported_type",
+                "symbol": "000001.SZ",
+                "start_date": "2023-01-01",
+                "end_date": "2023-12-31",
+            },
+            "rsi",
+        ),
+        # Daily data with parameters
+        (
+            "POST",
+            "/api/v1/factors/calculate",
+            _RSI_REQUEST,
+            "rsi",
+        ),
+        # Financial data with symbol
+        (
+            "POST",
+            "/api/v1/factors/calculate",
+            {
+                "factor_name": "pe_ratio_factor",
+                "data_type": "financial",
+                "symbol": "000001.SZ",
+                "start_date": "2023-01-01",
+                "end_date": "2023-12-31",
+            },
+            "pe_ratio_factor",
+        ),
+    ],
+)
+def test_factor_not_found(
+    client: TestClient,
+    superuser_token_headers: dict[str, str],
+    method: str,
+    url: str,
+    payload: dict | None,
+    expected_name: str,
+):
+    """Test endpoints that look up an unregistered factor"""
+    response = client.request(
+        method, url, json=payload, headers=superuser_token_headers
     )
 
-    # Should return 404 because factor doesn't exist, but validates parameter structure
     assert response.status_code == 404
     content = response.json()
     assert "detail" in content
-    assert "Factor 'rsi' not found" in content["detail"]
+    assert f"Factor '{expected_name}' not found" in content["detail"]
 
 
-def test_calculate_factor_industry_no_dates(
-    client: TestClient, superuser_token_headers: dict[str, str]
-):
+def test_calculate_factor_industry_no_dates():
     """Test factor calculation for industry data without dates"""
     request_data = {"factor_name": "industry_factor", "data_type": "industry"}
 
-    response = client.post(
-        "/api/v1/factors/calculate",
-        json=request_data,
-        headers=superuser_token_headers,
-    )
-
-    # Should return 404 because factor doesn't exist, but validates that industry data doesn't need dates
-    assert response.status_code == 422
-    content = response.json()
-    assert "detail" in content
-
-
-def test_calculate_factor_financial_with_symbol(
-    client: TestClient, superuser_token_headers: dict[str, str]
-):
-    """Test factor calculation for financial data with symbol"""
-    request_data = {
-        "factor_name": "pe_ratio_factor",
-        "data_type": "financial",
-        "symbol": "000001.SZ",
-        "start_date": "2023-01-01",
-        "end_date": "2023-12-31",
-    }
-
-    response = client.post(
-        "/api/v1/factors/calculate",
-        json=request_data,
-        headers=superuser_token_headers,
-    )
-
-    # Should return 404 because factor doesn't exist, but validates financial data structure
-    assert response.status_code == 404
-    content = response.json()
-    assert "detail" in content
-    assert "Factor 'pe_ratio_factor' not found" in content["detail"]
-
-
-def test_get_factor_status_not_found(
-    client: TestClient, superuser_token_headers: dict[str, str]
-):
-    """Test factor status query for non-existent factor"""
-    response = client.get(
-        "/api/v1/factors/nonexistent_factor/status",
-        headers=superuser_token_headers,
-    )
-
-    assert response.status_code == 404
-    content = response.json()
-    assert "detail" in content
-    assert "Factor 'nonexistent_factor' not found" in content["detail"]
-
-
-def test_get_factor_status_success(
-    client: TestClient, superuser_token_headers: dict[str, str]
-):
-    """Test successful factor status query"""
-    response = client.get(
-        "/api/v1/factors/rsi/status",
-        headers=superuser_token_headers,
-    )
-
-    assert response.status_code == 404
-    content = response.json()
-    assert "detail" in content
-    assert "Factor 'rsi' not found" in content["detail"]
+    # start_date and end_date are required, the route answers 422
+    with pytest.raises(ValidationError):
+        FactorCalculateRequest(**request_data)
 
 
+@pytest.mark.mutation
+@pytest.mark.xdist_group("factor_registry")
 def test_register_factor_success(
     client: TestClient, superuser_token_headers: dict[str, str]
 ):
     """Test successful factor registration"""
-    request_data = {
-        "name": "test_rsi",
-        "factor_type": "technical",
-        "description": "Relative Strength Index test factor",
-        "parameters": {"period": 14, "overbought": 70, "oversold": 30},
-        "required_fields": ["close"],
-    }
-
     response = client.post(
         "/api/v1/factors/register",
-        json=request_data,
-        headers=superuser_token_headers,
+        content=_REGISTER_RSI_BODY,
+        headers={**superuser_token_headers, **_JSON_CONTENT_TYPE},
     )
 
     assert response.status_code == 500
@@ -261,6 +177,8 @@ def test_register_factor_success(
     assert "detail" in content
 
 
+@pytest.mark.mutation
+@pytest.mark.xdist_group("factor_registry")
 def test_register_factor_already_exists(
     client: TestClient, superuser_token_headers: dict[str, str]
 ):
@@ -282,9 +200,7 @@ def test_register_factor_already_exists(
     assert "detail" in content
 
 
-def test_register_factor_invalid_data(
-    client: TestClient, superuser_token_headers: dict[str, str]
-):
+def test_register_factor_invalid_data():
     """Test factor registration with invalid data"""
     request_data = {
         "name": "",
@@ -294,42 +210,13 @@ def test_register_factor_invalid_data(
         "required_fields": ["close"],
     }
 
-    response = client.post(
-        "/api/v1/factors/register", json=request_data, headers=superuser_token_headers
-    )
-
-    assert response.status_code == 500
-    content = response.json()
-    assert "detail" in content
-
-
-def test_unregister_factor_not_found(
-    client: TestClient, superuser_token_headers: dict[str, str]
-):
-    """Test factor deletion for non-existent factor"""
-    response = client.delete(
-        "/api/v1/factors/nonexistent_factor",
-        headers=superuser_token_headers,
-    )
-
-    assert response.status_code == 404
-    content = response.json()
-    assert "detail" in content
-    assert "Factor 'nonexistent_factor' not found" in content["detail"]
-
-
-def test_unregister_factor_success(
-    client: TestClient, superuser_token_headers: dict[str, str]
-):
-    """Test successful factor deletion"""
-    response = client.delete("/api/v1/factors/rsi", headers=superuser_token_headers)
-
-    assert response.status_code == 404
-    content = response.json()
-    assert "detail" in content
-    assert "Factor 'rsi' not found" in content["detail"]
+    # factor_class is required, the route answers 422
+    with pytest.raises(ValidationError):
+        FactorRegisterRequest(**request_data)
 
 
+@pytest.mark.mutation
+@pytest.mark.xdist_group("factor_registry")
 def test_unregister_factor_service_error(
     client: TestClient, superuser_token_headers: dict[str, str]
 ):
@@ -3,15 +3,52 @@ Signal management API tests
 """
 
 import pytest
-from fastapi.testclient import TestClient
+import json
+from httpx import AsyncClient
 from typing import Dict
-
-
-def test_list_signals_success(
-    client: TestClient, superuser_token_headers: Dict[str, str]
+from unittest.mock import Mock
+
+from app.domains.signals.services import SignalPushService
+
+
+# Request bodies are only read, so they are built once per module
+_BUY_SIGNAL_REQUEST = {
+    "signal_type": "buy",
+    "symbol": "000001.SZ",
+    "action": "buy",
+    "confidence": 0.85,
+    "metadata": {"strategy": "rsi", "price": 10.50},
+}
+_BUY_SIGNAL_BODY = json.dumps(_BUY_SIGNAL_REQUEST).encode()
+_JSON_CONTENT_TYPE = {"content-type": "application/json"}
+
+
+@pytest.fixture
+def mock_signal_service(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    """Make the service fail at once so 500 tests skip the database work"""
+    mock = Mock(spec=SignalPushService)
+    for method in ("list_signals", "get_signal", "create_signal"):
+        getattr(mock, method).side_effect = RuntimeError("boom")
+    monkeypatch.setattr("app.api.routes.signals.signal_push_service", mock)
+    return mock
+
+
+@pytest.fixture
+def stub_signal_service(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    """Answer with an empty signal page and no stored signals"""
+    mock = Mock(spec=SignalPushService)
+    mock.list_signals.return_value = {"data": [], "total": 0}
+    mock.get_signal.return_value = None
+    monkeypatch.setattr("app.api.routes.signals.signal_push_service", mock)
+    return mock
+
+
+@pytest.mark.usefixtures("mock_signal_service")
+async def test_list_signals_service_error(
+    async_client: AsyncClient, superuser_token_headers: Dict[str, str]
 ):
-    """Test successful signal listing"""
-    response = client.get(
+    """Test signal listing returns 500 when the service fails"""
+    response = await async_client.get(
         "/api/v1/signals/",
         headers=superuser_token_headers,
     )
@@ -21,65 +58,67 @@ def test_list_signals_success(
     assert "detail" in content
 
 
-def test_list_signals_with_filter(
-    client: TestClient, superuser_token_headers: Dict[str, str]
+async def test_list_signals_with_filter(
+    async_client: AsyncClient,
+    superuser_token_headers: Dict[str, str],
+    stub_signal_service: Mock,
 ):
-    """test signal listing with type filter"""
+    """test signal listing with symbol filter"""
 
-    response = client.get(
-        "/api/v1/signals/?signal_type=buy&symbol=000001.SZ",
+    response = await async_client.get(
+        "/api/v1/signals/?symbol=000001.SZ",
         headers=superuser_token_headers,
     )
 
-    assert response.status_code == 500
-    content = response.json()
-    assert "detail" in content
+    assert response.status_code == 200
+    stub_signal_service.list_signals.assert_called_once_with(
+        symbol="000001.SZ", page=1, size=20
+    )
 
 
-def test_list_signals_with_pagination(
-    client: TestClient, superuser_token_headers: Dict[str, str]
+async def test_list_signals_with_pagination(
+    async_client: AsyncClient,
+    superuser_token_headers: Dict[str, str],
+    stub_signal_service: Mock,
 ):
     """Test signal listing with pagination"""
 
-    response = client.get(
-        "/api/v1/signals/?page=1&size=10", headers=superuser_token_headers
+    response = await async_client.get(
+        "/api/v1/signals/?page=2&size=10", headers=superuser_token_headers
     )
 
-    assert response.status_code == 500
-    content = response.json()
-    assert "detail" in content
-
-
-def test_list_signals_unauthorized(client: TestClient):
-    """Test signal listing without authentication"""
-
-    response = client.get("/api/v1/signals/")
-
-    assert response.status_code == 401
+    assert response.status_code == 200
     content = response.json()
-    assert "detail" in content
+    assert content["page"] == 2
+    assert content["size"] == 10
+    stub_signal_service.list_signals.assert_called_once_with(
+        symbol=None, page=2, size=10
+    )
 
 
-def test_get_signal_not_found(
-    client: TestClient, superuser_token_headers: Dict[str, str]
+async def test_get_signal_not_found(
+    async_client: AsyncClient,
+    superuser_token_headers: Dict[str, str],
+    stub_signal_service: Mock,
 ):
     """test getting non-existent signal"""
-    response = client.get(
+    response = await async_client.get(
         "/api/v1/signals/nonexistent_signal",
         headers=superuser_token_headers,
     )
 
-    assert response.status_code == 500
+    assert response.status_code == 404
     content = response.json()
-    assert "detail" in content
-    assert "Internal server error" in content["detail"]
+    assert "not found" in content["detail"]
+    stub_signal_service.get_signal.assert_called_once_with("nonexistent_signal")
 
 
-def test_get_signal_success(
-    client: TestClient, superuser_token_headers: Dict[str, str]
+@pytest.mark.usefixtures("mock_signal_service")
+async def test_get_signal_service_error(
+    async_client: AsyncClient, superuser_token_headers: Dict[str, str]
 ):
-    """test successful signal retrieval"""
-    response = client.get(
+    """Test signal retrieval returns 500 when the service fails"""
+    response = await async_client.get(
         "/api/v1/signals/test_signal_123",
         headers=superuser_token_headers,
     )
@@ -90,20 +129,14 @@ def test_get_signal_success(
     assert "Internal server error" in content["detail"]
 
 
-def test_create_signal_success(
-    client: TestClient, superuser_token_headers: Dict[str, str]
+async def test_create_signal_success(
+    async_client: AsyncClient, superuser_token_headers: Dict[str, str]
 ):
     """Test successful signal creation"""
-    request_data = {
-        "signal_type": "buy",
-        "symbol": "000001.SZ",
-        "action": "buy",
-        "confidence": 0.85,
-        "metadata": {"strategy": "rsi", "price": 10.50},
-    }
-
-    response = client.post(
-        "/api/v1/signals/", json=request_data, headers=superuser_token_headers
+    response = await async_client.post(
+        "/api/v1/signals/",
+        content=_BUY_SIGNAL_BODY,
+        headers={**superuser_token_headers, **_JSON_CONTENT_TYPE},
     )
 
     assert response.status_code == 500
@@ -111,8 +144,8 @@ def test_create_signal_success(
     assert "detail" in content
 
 
-def test_create_signal_invalid_data(
-    client: TestClient, superuser_token_headers: Dict[str, str]
+async def test_create_signal_invalid_data(
+    async_client: AsyncClient, superuser_token_headers: Dict[str, str]
 ):
     """Test signal creation with invalid data"""
     request_data = {
@@ -122,7 +155,7 @@ def test_create_signal_invalid_data(
         "confidence": 1.5,
     }
 
-    response = client.post(
+    response = await async_client.post(
         "/api/v1/signals/", json=request_data, headers=superuser_token_headers
     )
 
@@ -131,16 +164,20 @@ def test_create_signal_invalid_data(
     assert "detail" in content
 
 
-def test_create_signal_unauthorized(client: TestClient):
-    """Test signal creation without authentication"""
-    request_data = {
-        "signal_type": "buy",
-        "symbol": "000001.SZ",
-        "action": "buy",
-        "confidence": 0.85,
-    }
+async def test_list_signals_unauthorized(async_client: AsyncClient):
+    """Test signal listing without authentication"""
+    response = await async_client.get("/api/v1/signals/")
 
-    response = client.post("/api/v1/signals/", json=request_data)
+    assert response.status_code == 401
+    content = response.json()
+    assert "detail" in content
+
+
+async def test_create_signal_unauthorized(async_client: AsyncClient):
+    """Test signal creation without authentication"""
+    response = await async_client.post(
+        "/api/v1/signals/", content=_BUY_SIGNAL_BODY, headers=_JSON_CONTENT_TYPE
+    )
 
     assert response.status_code == 401
     content = response.json()
@@ -3,9 +3,26 @@ Tests for strategy API routes
 """
 
 from fastapi.testclient import TestClient
+from httpx import AsyncClient
+import json
 from app.core.config import settings
 import pytest
+from collections.abc import Generator
 from unittest.mock import AsyncMock, patch
+from sqlmodel import Session, select
+
+from app.api.routes import strategies
+from app.models import BacktestResult
+from tests.utils.backtest import (
+    PAGED_COUNT,
+    PAGED_STRATEGY,
+    SEEDED_STRATEGY,
+    make_backtest_result,
+)
+
+API = settings.API_V1_STR
+# Well-formed id that no seeded backtest result uses
+_MISSING_ID = "123e4567-e89b-12d3-a456-426614174000"
 
 
 def test_list_strategies(
@@ -13,7 +30,7 @@ def test_list_strategies(
 ) -> None:
     """Test listing all strategies"""
     response = client.get(
-        f"{settings.API_V1_STR}/strategies/", headers=superuser_token_headers
+        f"{API}/strategies/", headers=superuser_token_headers
     )
 
     assert response.status_code == 200
@@ -29,7 +46,7 @@ def test_get_strategy(
 ) -> None:
     """Test getting strategy detail by name"""
     response = client.get(
-        f"{settings.API_V1_STR}/strategies/DualMovingAverageStrategy",
+        f"{API}/strategies/DualMovingAverageStrategy",
         headers=superuser_token_headers,
     )
 
@@ -45,7 +62,7 @@ def test_get_strategy_not_found(
 ) -> None:
     """Test getting non-existent strategy returns 404"""
     response = client.get(
-        f"{settings.API_V1_STR}/strategies/NonExistentStrategy",
+        f"{API}/strategies/NonExistentStrategy",
         headers=superuser_token_headers,
     )
 
@@ -55,69 +72,81 @@ def test_get_strategy_not_found(
     assert "NonExistentStrategy" in content["detail"]
 
 
-@pytest.mark.asyncio
+# Request bodies and mock results are only read, so they are built once per module
+_BACKTEST_REQUEST = {
+    "symbol": "000001.SZ",
+    "start_date": "2024-01-01",
+    "end_date": "2024-01-31",
+    "initial_capital": 1000000.0,
+}
+_BACKTEST_BODY = json.dumps(_BACKTEST_REQUEST).encode()
+_JSON_CONTENT_TYPE = {"content-type": "application/json"}
+
+_DEFAULT_BACKTEST_RESULT = {
+    "backtest_id": "test-backtest-id-123",
+    "strategy_name": "DualMovingAverageStrategy",
+    "symbol": "000001.SZ",
+    "start_date": "2024-01-01",
+    "end_date": "2024-01-31",
+    "initial_capital": 1000000.0,
+    "performance": {
+        "total_return": 10000.0,
+        "total_return_pct": 1.0,
+        "final_value": 1010000.0,
+    },
+    "status": "completed",
+}
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _patched_run_backtest() -> Generator[AsyncMock, None, None]:
+    # No test in this module should start a real backtest, so the patch is
+    # installed once for the whole module
+    with patch.object(
+        strategies.strategy_service, "run_backtest", new_callable=AsyncMock
+    ) as mock:
+        yield mock
+
+
+@pytest.fixture
+def mock_run_backtest(_patched_run_backtest: AsyncMock) -> AsyncMock:
+    """The module's run_backtest mock, reset to the default result"""
+    _patched_run_backtest.reset_mock()
+    _patched_run_backtest.return_value = _DEFAULT_BACKTEST_RESULT
+    return _patched_run_backtest
+
+
 async def test_run_backtest(
-    client: TestClient, superuser_token_headers: dict[str, str]
+    async_client: AsyncClient,
+    superuser_token_headers: dict[str, str],
+    mock_run_backtest: AsyncMock,
 ) -> None:
     """Test running a backtest"""
-    from app.api.routes import strategies
-
-    mock_result = {
-        "backtest_id": "test-backtest-id-123",
-        "strategy_name": "DualMovingAverageStrategy",
-        "symbol": "000001.SZ",
-        "start_date": "2024-01-01",
-        "end_date": "2024-01-31",
-        "initial_capital": 1000000.0,
-        "performance": {
-            "total_return": 10000.0,
-            "total_return_pct": 1.0,
-            "final_value": 1010000.0,
-        },
-        "status": "completed",
-    }
+    response = await async_client.post(
+        f"{API}/strategies/DualMovingAverageStrategy/backtest",
+        headers={**superuser_token_headers, **_JSON_CONTENT_TYPE},
+        content=_BACKTEST_BODY,
+    )
+
+    assert response.status_code == 200
+    content = response.json()
+    assert "backtest_id" in content
+    assert content["strategy_name"] == "DualMovingAverageStrategy"
+    assert content["symbol"] == "000001.SZ"
+    assert "performance" in content
+    assert content["performance"]["total_return"] == 10000.0
+
+    assert mock_run_backtest.called
+
 
-    with patch.object(
-        strategies.strategy_service, "run_backtest", new_callable=AsyncMock
-    ) as mock_run_backtest:
-        mock_run_backtest.return_value = mock_result
-
-        response = client.post(
-            f"{settings.API_V1_STR}/strategies/DualMovingAverageStrategy/backtest",
-            headers=superuser_token_headers,
-            json={
-                "symbol": "000001.SZ",
-                "start_date": "2024-01-01",
-                "end_date": "2024-01-31",
-                "initial_capital": 1000000.0,
-            },
-        )
-
-        assert response.status_code == 200
-        content = response.json()
-        assert "backtest_id" in content
-        assert content["strategy_name"] == "DualMovingAverageStrategy"
-        assert content["symbol"] == "000001.SZ"
-        assert "performance" in content
-        assert content["performance"]["total_return"] == 10000.0
-
-        assert mock_run_backtest.called
-
-
-@pytest.mark.asyncio
 async def test_run_backtest_not_found(
-    client: TestClient, superuser_token_headers: dict[str, str]
+    async_client: AsyncClient, superuser_token_headers: dict[str, str]
 ) -> None:
     """Test running backtest with non-existent strategy returns 404"""
-    response = client.post(
-        f"{settings.API_V1_STR}/strategies/NonExistentStrategy/backtest",
-        headers=superuser_token_headers,
-        json={
-            "symbol": "000001.SZ",
-            "start_date": "2024-01-01",
-            "end_date": "2024-01-31",
-            "initial_capital": 1000000.0,
-        },
+    response = await async_client.post(
+        f"{API}/strategies/NonExistentStrategy/backtest",
+        headers={**superuser_token_headers, **_JSON_CONTENT_TYPE},
+        content=_BACKTEST_BODY,
     )
 
     assert response.status_code == 404
@@ -127,77 +156,39 @@ async def test_run_backtest_not_found(
 
 
 def test_get_backtest_result_success(
-    client: TestClient, superuser_token_headers: dict[str, str]
+    client_with_db: TestClient,
+    superuser_token_headers: dict[str, str],
+    seeded_session: Session,
 ):
     """Test successful backtest result retrieval"""
+    backtest_result = seeded_session.exec(
+        select(BacktestResult).where(BacktestResult.strategy_name == SEEDED_STRATEGY)
+    ).first()
 
-    from app.models import BacktestResult
-    from uuid import uuid4
-    import json
-    from unittest.mock import MagicMock
-
-    backtest_result = BacktestResult(
-        id=uuid4(),
-        strategy_name="test_strategy",
-        symbol="000001.SZ",
-        start_date="2023-01-01",
-        end_date="2023-12-31",
-        initial_capital=1000000.0,
-        final_value=1050000.0,
-        total_return=0.05,
-        max_drawdown=-0.03,
-        sharpe_ratio=1.2,
-        total_trades=25,
-        winning_trades=15,
-        losing_trades=10,
-        win_rate=0.6,
-        result_data=json.dumps(
-            {"performance": {"total_return_pct": 0.05, "calmar_ratio": 1.2}}
-        ),
-        created_by="test@example.com",
+    response = client_with_db.get(
+        f"{API}/strategies/{SEEDED_STRATEGY}/backtests/{backtest_result.id}",
+        headers=superuser_token_headers,
     )
 
-    mock_session = MagicMock()
-    mock_session.exec.return_value.first.return_value = backtest_result
-
-    from app.api.deps import get_db
-    from app.main import app
-
-    def override_get_db():
-        yield mock_session
-
-    app.dependency_overrides[get_db] = override_get_db
-
-    try:
-        response = client.get(
-            f"/api/v1/strategies/test_strategy/backtests/{backtest_result.id}",
-            headers=superuser_token_headers,
-        )
-
-        assert response.status_code == 200
-        content = response.json()
-        assert content["backtest_id"] == str(backtest_result.id)
-        assert content["strategy_name"] == "test_strategy"
-        assert content["symbol"] == "000001.SZ"
-        assert content["performance"]["total_return"] == 0.05
-        assert content["performance"]["calmar_ratio"] == 1.2
-
-    finally:
-        app.dependency_overrides.clear()
+    assert response.status_code == 200
+    content = response.json()
+    assert content["backtest_id"] == str(backtest_result.id)
+    assert content["strategy_name"] == SEEDED_STRATEGY
+    assert content["symbol"] == "000001.SZ"
+    assert content["performance"]["total_return"] == 0.05
+    assert content["performance"]["calmar_ratio"] == 1.2
 
 
 def test_get_backtest_result_not_found(
-    client: TestClient, superuser_token_headers: dict[str, str]
+    client_with_db: TestClient, superuser_token_headers: dict[str, str]
 ):
     """Test backtest result not found"""
 
-    with patch("sqlmodel.Session") as mock_session:
-        mock_session.exec.return_value.first.return_value = None
-
-        response = client.get(
-            "/api/v1/strategies/test_strategy/backtests/123e4567-e89b-12d3-a456-426614174000",
-            headers=superuser_token_headers,
-        )
+    # The seeded session holds no result with this id
+    response = client_with_db.get(
+        f"{API}/strategies/test_strategy/backtests/{_MISSING_ID}",
+        headers=superuser_token_headers,
+    )
 
     assert response.status_code == 404
     content = response.json()
@@ -210,7 +201,7 @@ def test_get_backtest_result_invalid_id(
 ):
     """Test invalid backtest ID format"""
     response = client.get(
-        "/api/v1/strategies/test_strategy/backtests/invalid-uuid",
+        f"{API}/strategies/test_strategy/backtests/invalid-uuid",
         headers=superuser_token_headers,
     )
 
@@ -221,55 +212,13 @@ def test_get_backtest_result_invalid_id(
 
 
 def test_get_backtest_history_success(
-    client: TestClient, superuser_token_headers: dict[str, str]
+    client_with_db: TestClient, superuser_token_headers: dict[str, str]
 ):
     """Test successful backtest history retrieval"""
-    from app.models import BacktestResult
-    from uuid import uuid4
-    from datetime import datetime
-    from unittest.mock import MagicMock
-
-    backtest_results = [
-        BacktestResult(
-            id=uuid4(),
-            strategy_name="test_strategy",
-            symbol="000001.SZ",
-            start_date="2023-01-01",
-            end_date="2023-12-31",
-            initial_capital=1000000.0,
-            final_value=1050000.0,
-            total_return=0.05,
-            max_drawdown=-0.03,
-            sharpe_ratio=1.2,
-            total_trades=25,
-            winning_trades=15,
-            losing_trades=10,
-            win_rate=0.6,
-            result_data="{}",
-            created_by="test@example.com",
-            created_at=datetime.utcnow(),
-        )
-    ]
-
-    mock_session = MagicMock()
-    mock_session.exec.return_value.one.return_value = 1
-    mock_session.exec.return_value.all.return_value = backtest_results
-
-    from app.api.deps import get_db
-    from app.main import app
-
-    def override_get_db():
-        yield mock_session
-
-    app.dependency_overrides[get_db] = override_get_db
-
-    try:
-        response = client.get(
-            "/api/v1/strategies/test_strategy/backtests?page=1&size=20",
-            headers=superuser_token_headers,
-        )
-    finally:
-        app.dependency_overrides.clear()
+    response = client_with_db.get(
+        f"{API}/strategies/{SEEDED_STRATEGY}/backtests?page=1&size=20",
+        headers=superuser_token_headers,
+    )
 
     assert response.status_code == 200
     content = response.json()
@@ -278,129 +227,72 @@ def test_get_backtest_history_success(
     assert content["size"] == 20
     assert content["total_pages"] == 1
     assert len(content["data"]) == 1
-    assert content["data"][0]["strategy_name"] == "test_strategy"
+    assert content["data"][0]["strategy_name"] == SEEDED_STRATEGY
 
 
 def test_get_backtest_history_pagination(
-    client: TestClient, superuser_token_headers: dict[str, str]
+    client_with_db: TestClient, superuser_token_headers: dict[str, str]
 ):
     """Test backtest history pagination"""
-    from unittest.mock import MagicMock
-
-    mock_session = MagicMock()
-    mock_session.exec.return_value.one.return_value = 25
-    mock_session.exec.return_value.all.return_value = []
-
-    from app.api.deps import get_db
-    from app.main import app
-
-    def override_get_db():
-        yield mock_session
-
-    app.dependency_overrides[get_db] = override_get_db
-
-    try:
-        response = client.get(
-            "/api/v1/strategies/test_strategy/backtests?page=2&size=10",
-            headers=superuser_token_headers,
-        )
-    finally:
-        app.dependency_overrides.clear()
+    response = client_with_db.get(
+        f"{API}/strategies/{PAGED_STRATEGY}/backtests?page=2&size=10",
+        headers=superuser_token_headers,
+    )
 
     assert response.status_code == 200
     content = response.json()
-    assert content["count"] == 25
+    assert content["count"] == PAGED_COUNT
     assert content["page"] == 2
     assert content["size"] == 10
     assert content["total_pages"] == 3
+    assert len(content["data"]) == 10
 
 
+@pytest.mark.parametrize("page,size", [(0, 20), (1, 0), (1, 101)])
 def test_get_backtest_history_invalid_pagination(
-    client: TestClient, superuser_token_headers: dict[str, str]
+    client: TestClient, superuser_token_headers: dict[str, str], page: int, size: int
 ):
     """Test invalid pagination parameters"""
     response = client.get(
-        "/api/v1/strategies/test_strategy/backtests?page=0&size=20",
+        f"{API}/strategies/test_strategy/backtests?page={page}&size={size}",
         headers=superuser_token_headers,
     )
-    assert response.status_code == 400
 
-    response = client.get(
-        "/api/v1/strategies/test_strategy/backtests?page=1&size=0",
-        headers=superuser_token_headers,
-    )
-    assert response.status_code == 400
-
-    response = client.get(
-        "/api/v1/strategies/test_strategy/backtests?page=1&size=101",
-        headers=superuser_token_headers,
-    )
     assert response.status_code == 400
 
 
 def test_delete_backtest_result_success(
-    client: TestClient, superuser_token_headers: dict[str, str]
+    client_with_db: TestClient,
+    superuser_token_headers: dict[str, str],
+    seeded_session: Session,
 ):
     """Test successful backtest result deletion"""
-    from app.models import BacktestResult
-    from uuid import uuid4
-    from unittest.mock import MagicMock
-
-    backtest_result = BacktestResult(
-        id=uuid4(),
-        strategy_name="test_strategy",
-        symbol="000001.SZ",
-        start_date="2023-01-01",
-        end_date="2023-12-31",
-        initial_capital=1000000.0,
-        final_value=1050000.0,
-        total_return=0.05,
-        max_drawdown=-0.03,
-        sharpe_ratio=1.2,
-        total_trades=25,
-        winning_trades=15,
-        losing_trades=10,
-        win_rate=0.6,
-        result_data="{}",
-        created_by="test@example.com",
-    )
-
-    mock_session = MagicMock()
-    mock_session.exec.return_value.first.return_value = backtest_result
-
-    from app.api.deps import get_db
-    from app.main import app
+    # Delete a row of its own so the shared seed stays intact for other tests
+    backtest_result = make_backtest_result(strategy_name="delete_strategy")
+    seeded_session.add(backtest_result)
+    seeded_session.commit()
 
-    def override_get_db():
-        yield mock_session
-
-    app.dependency_overrides[get_db] = override_get_db
-
-    try:
-        response = client.delete(
-            "/api/v1/strategies/test_strategy/backtests/" + str(backtest_result.id),
-            headers=superuser_token_headers,
-        )
-    finally:
-        app.dependency_overrides.clear()
+    response = client_with_db.delete(
+        f"{API}/strategies/delete_strategy/backtests/{backtest_result.id}",
+        headers=superuser_token_headers,
+    )
 
     assert response.status_code == 200
     content = response.json()
     assert "message" in content
     assert "deleted successfully" in content["message"]
+    assert seeded_session.get(BacktestResult, backtest_result.id) is None
 
 
 def test_delete_backtest_result_not_found(
-    client: TestClient, superuser_token_headers: dict[str, str]
+    client_with_db: TestClient, superuser_token_headers: dict[str, str]
 ):
     """Test delete non-existent backtest result"""
-    with patch("sqlmodel.Session") as mock_session:
-        mock_session.exec.return_value.first.return_value = None
-
-        response = client.delete(
-            "/api/v1/strategies/test_strategy/backtests/123e4567-e89b-12d3-a456-426614174000",
-            headers=superuser_token_headers,
-        )
+    # The seeded session holds no result with this id
+    response = client_with_db.delete(
+        f"{API}/strategies/test_strategy/backtests/{_MISSING_ID}",
+        headers=superuser_token_headers,
+    )
 
     assert response.status_code == 404
     content = response.json()
@@ -414,7 +306,7 @@ def test_delete_backtest_result_invalid_id(
     """Test delete with invalid backtest ID format"""
 
     response = client.delete(
-        "/api/v1/strategies/test_strategy/backtests/invalid-uuid",
+        f"{API}/strategies/test_strategy/backtests/invalid-uuid",
         headers=superuser_token_headers,
     )
 
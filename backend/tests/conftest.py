@@ -1,22 +1,70 @@
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 
+import orjson
 import pytest
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
-from sqlmodel import Session, delete
+from httpx import ASGITransport, AsyncClient, Response
+from sqlmodel import Session, delete, text
 
+from app import crud
 from app.core.config import settings
 from app.core.db import engine, init_db
+from app.domains.signals.services import SignalPushService
+from app.domains.strategies.services import StrategyService
 from app.main import app
 from app.models import Item, User
-from tests.utils.user import authentication_token_from_email
-from tests.utils.utils import get_superuser_token_headers
+from tests.utils.user import authentication_token_from_email, token_headers_for_user
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--run-integration",
+        action="store_true",
+        default=False,
+        help="run tests marked integration, which call live data sources",
+    )
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    if config.getoption("--run-integration"):
+        return
+    skip_integration = pytest.mark.skip(reason="integration; pass --run-integration")
+    for item in items:
+        if "integration" in item.keywords:
+            item.add_marker(skip_integration)
+
+
+# Arbitrary key for the advisory lock that serializes init_db across xdist workers
+_INIT_DB_LOCK_KEY = 7202501
 
 
 @pytest.fixture(scope="session", autouse=True)
-def db() -> Generator[Session, None, None]:
+def db(request: pytest.FixtureRequest) -> Generator[Session, None, None]:
+    # Set on pytest-xdist workers, absent on a plain serial run
+    is_xdist_worker = hasattr(request.config, "workerinput")
     with Session(engine) as session:
-        init_db(session)
+        if is_xdist_worker:
+            # The lock is held per connection and init_db commits, which hands
+            # the Session's connection back to the pool, so lock and unlock go
+            # through one dedicated connection instead
+            with engine.connect() as lock_conn:
+                lock_conn.execute(text(f"SELECT pg_advisory_lock({_INIT_DB_LOCK_KEY})"))
+                try:
+                    init_db(session)
+                finally:
+                    lock_conn.execute(
+                        text(f"SELECT pg_advisory_unlock({_INIT_DB_LOCK_KEY})")
+                    )
+        else:
+            init_db(session)
         yield session
+        # Workers share the database, one of them wiping users would break
+        # tests still running on the others
+        if is_xdist_worker:
+            return
         statement = delete(Item)
         session.execute(statement)
         statement = delete(User)
@@ -24,19 +72,54 @@ def db() -> Generator[Session, None, None]:
         session.commit()
 
 
-@pytest.fixture(scope="module")
-def client() -> Generator[TestClient, None, None]:
-    with TestClient(app) as c:
+@pytest.fixture(scope="session", autouse=True)
+def _orjson_responses() -> Generator[None, None, None]:
+    # Tests parse every response body, orjson decodes them faster than stdlib json
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(Response, "json", lambda self, **kwargs: orjson.loads(self.content))
+        yield
+
+
+@pytest.fixture(scope="session")
+def app_instance() -> FastAPI:
+    # Build the OpenAPI schema up front instead of inside the first test
+    app.openapi()
+    return app
+
+
+@pytest.fixture(scope="session")
+def client(app_instance: FastAPI) -> Generator[TestClient, None, None]:
+    with TestClient(app_instance) as c:
         yield c
 
 
-@pytest.fixture(scope="module")
-def superuser_token_headers(client: TestClient) -> dict[str, str]:
-    return get_superuser_token_headers(client)
+@pytest.fixture
+async def async_client(app_instance: FastAPI) -> AsyncGenerator[AsyncClient, None]:
+    async with AsyncClient(
+        transport=ASGITransport(app=app_instance), base_url="http://test"
+    ) as c:
+        yield c
 
 
-@pytest.fixture(scope="module")
-def normal_user_token_headers(client: TestClient, db: Session) -> dict[str, str]:
-    return authentication_token_from_email(
-        client=client, email=settings.EMAIL_TEST_USER, db=db
-    )
+@pytest.fixture(scope="session")
+def superuser_token_headers(db: Session) -> dict[str, str]:
+    user = crud.get_user_by_email(session=db, email=settings.FIRST_SUPERUSER)
+    assert user is not None
+    return token_headers_for_user(user)
+
+
+@pytest.fixture(scope="session")
+def normal_user_token_headers(db: Session) -> dict[str, str]:
+    return authentication_token_from_email(email=settings.EMAIL_TEST_USER, db=db)
+
+
+@pytest.fixture(scope="session")
+def strategy_service() -> StrategyService:
+    """One StrategyService shared by the domain and integration tests"""
+    return StrategyService()
+
+
+@pytest.fixture(scope="session")
+def signal_push_service() -> SignalPushService:
+    """One SignalPushService so push channels are set up once per session"""
+    return SignalPushService()
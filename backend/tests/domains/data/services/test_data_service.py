@@ -0,0 +1,128 @@
+"""
+Data service tests
+Test the in-memory memo in front of InfluxDB and the data sources
+"""
+
+from datetime import date, timedelta
+from unittest.mock import AsyncMock, patch
+
+import pandas as pd
+import pytest
+
+from app.domains.data.services import DataService
+
+_FRAME = pd.DataFrame(
+    {
+        "timestamp": pd.date_range("2024-01-02", periods=3, freq="D"),
+        "symbol": "000001.SZ",
+        "close": [10.0, 10.5, 10.2],
+    }
+)
+
+
+@pytest.fixture
+def service():
+    """A DataService whose InfluxDB and data source calls are mocked"""
+    service = DataService()
+    with (
+        patch.object(
+            service,
+            "get_data_from_influxdb",
+            new_callable=AsyncMock,
+            return_value=pd.DataFrame(),
+        ),
+        patch.object(service, "store_data_to_influxdb", new_callable=AsyncMock),
+        patch.object(
+            service.data_source_factory,
+            "fetch_data_with_fallback",
+            new_callable=AsyncMock,
+            return_value=_FRAME,
+        ),
+    ):
+        yield service
+    service.influxdb_client.close()
+
+
+async def test_past_range_is_memoized(service):
+    """Test a past date range is fetched once and then served from memory"""
+    kwargs = {
+        "data_type": "daily",
+        "symbol": "000001.SZ",
+        "start_date": "2024-01-01",
+        "end_date": "2024-01-05",
+    }
+
+    first = await service.fetch_data(**kwargs)
+    second = await service.fetch_data(**kwargs)
+
+    assert second is first
+    assert service.data_source_factory.fetch_data_with_fallback.await_count == 1
+
+    service.clear_memo()
+    await service.fetch_data(**kwargs)
+    assert service.data_source_factory.fetch_data_with_fallback.await_count == 2
+
+
+async def test_open_range_is_not_memoized(service):
+    """Test a range ending today is fetched again on every call"""
+    kwargs = {
+        "data_type": "daily",
+        "symbol": "000001.SZ",
+        "start_date": "2024-01-01",
+        "end_date": date.today().strftime("%Y-%m-%d"),
+    }
+
+    await service.fetch_data(**kwargs)
+    await service.fetch_data(**kwargs)
+
+    assert service.data_source_factory.fetch_data_with_fallback.await_count == 2
+
+
+async def test_memo_is_skipped_without_cache(service):
+    """Test use_cache=False bypasses the memo"""
+    end_date = (date.today() - timedelta(days=30)).strftime("%Y-%m-%d")
+    kwargs = {
+        "data_type": "daily",
+        "symbol": "000001.SZ",
+        "start_date": "2024-01-01",
+        "end_date": end_date,
+        "use_cache": False,
+    }
+
+    await service.fetch_data(**kwargs)
+    await service.fetch_data(**kwargs)
+
+    assert service.data_source_factory.fetch_data_with_fallback.await_count == 2
+
+
+async def test_fetch_many_returns_a_frame_per_symbol(service):
+    """Test fetch_many fetches every symbol and keys the frames by symbol"""
+    symbols = ["000001.SZ", "000002.SZ", "600000.SH"]
+
+    frames = await service.fetch_many(
+        data_type="daily",
+        symbols=symbols,
+        start_date="2024-01-01",
+        end_date="2024-01-05",
+        max_concurrency=2,
+    )
+
+    assert list(frames) == symbols
+    assert all(frame is _FRAME for frame in frames.values())
+    fetch = service.data_source_factory.fetch_data_with_fallback
+    assert fetch.await_count == len(symbols)
+
+
+async def test_fetch_many_fetches_duplicate_symbols_once(service):
+    """Test a symbol listed twice is fetched once and keeps its first position"""
+    frames = await service.fetch_many(
+        data_type="daily",
+        symbols=["000001.SZ", "000002.SZ", "000001.SZ"],
+        start_date="2024-01-01",
+        end_date="2024-01-05",
+        use_cache=False,
+    )
+
+    assert list(frames) == ["000001.SZ", "000002.SZ"]
+    fetch = service.data_source_factory.fetch_data_with_fallback
+    assert fetch.await_count == 2
@@ -15,13 +15,15 @@ logger = logging.getLogger(__name__)
 class TestDataServiceIntegration:
     """Integration test for data service with real InfluxDB and data sources"""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def service(self):
-        """Create data service instance"""
-        return DataService()
+        """Create data service instance shared by the module"""
+        service = DataService()
+        yield service
+        service.write_api.close()
+        service.influxdb_client.close()
 
-    @pytest.mark.asyncio
-    async def test_service_initialization(self, service):
+    def test_service_initialization(self, service):
         """Test service initializes correctly with InfluxDB and data source factory"""
 
         assert service is not None, "Service should be initialized"
@@ -34,7 +36,6 @@ class TestDataServiceIntegration:
 
         logger.info("Data service initialized with InfluxDB and data source factory")
 
-    @pytest.mark.asyncio
     async def test_fetch_data_without_cache(self, service):
         """Test fetching data directly from data sources (bypass cache)"""
 
@@ -60,7 +61,6 @@ class TestDataServiceIntegration:
         else:
             logger.info("No data available - graceful degradation verified")
 
-    @pytest.mark.asyncio
     async def test_fetch_data_with_cache_write(self, service):
         """Test fetching data with cache enabled (should write to InfluxDB)"""
 
@@ -78,6 +78,10 @@ class TestDataServiceIntegration:
             assert len(data) > 0, "Should have data rows"
             logger.info("Successfully fetched %d rows with cache", len(data))
 
+            # The in-memory memo would answer the repeat, drop it so the
+            # second fetch reads back from InfluxDB
+            service.clear_memo()
+
             cached_data = await service.fetch_data(
                 data_type="daily",
                 symbol="000001.SZ",
@@ -0,0 +1,21 @@
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+CASSETTE_DIR = Path(__file__).resolve().parents[3] / "cassettes"
+
+
+@pytest.fixture(scope="module")
+def vcr_config() -> dict[str, Any]:
+    # Keep the Tushare token and any auth header out of recorded cassettes
+    return {
+        "filter_query_parameters": ["token"],
+        "filter_post_data_parameters": ["token"],
+        "filter_headers": ["authorization"],
+    }
+
+
+@pytest.fixture(scope="module")
+def vcr_cassette_dir(request: pytest.FixtureRequest) -> str:
+    return str(CASSETTE_DIR / request.module.__name__.rsplit(".", 1)[-1])
@@ -15,28 +15,25 @@ logger = logging.getLogger(__name__)
 class TestDataSourceFactoryIntegration:
     """Integration test for data source factory with real data sources"""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def factory(self):
         """Create data source factory with real configuration"""
         return DataSourceFactory()
 
-    @pytest.mark.asyncio
-    async def test_factory_initialization(self, factory):
+    def test_factory_initialization(self, factory):
         """Test factory initializes all configured data sources"""
         assert factory is not None
         assert len(factory.sources) >= 2, "Should have at least Tushare and Akshare"
 
-        tushare_source = next((s for s in factory.sources if s.name == "tushare"), None)
-        assert tushare_source is not None, "Tushare source should be initialized"
-        assert tushare_source.priority == 1, "Tushare should have priority 1"
+        by_name = {s.name: s for s in factory.sources}
+        assert "tushare" in by_name, "Tushare source should be initialized"
+        assert by_name["tushare"].priority == 1, "Tushare should have priority 1"
 
-        akshare_source = next((s for s in factory.sources if s.name == "akshare"), None)
-        assert akshare_source is not None, "Akshare source should be initialized"
-        assert akshare_source.priority == 2, "Akshare should have priority 2"
+        assert "akshare" in by_name, "Akshare source should be initialized"
+        assert by_name["akshare"].priority == 2, "Akshare should have priority 2"
 
         logger.info("Factory initialized with %d data sources", len(factory.sources))
 
-    @pytest.mark.asyncio
     async def test_fetch_with_fallback_mechanism(self, factory):
         """Test factory fallback mechanism when primary source fails"""
 
@@ -56,7 +53,6 @@ class TestDataSourceFactoryIntegration:
 
         logger.info("Fallback mechanism test passed with %d rows", len(data))
 
-    @pytest.mark.asyncio
     async def test_source_priority_ordering(self, factory):
         """Test the sources are tried in priority order"""
 
@@ -75,7 +71,6 @@ class TestDataSourceFactoryIntegration:
             "Priority ordering verified: %s", [s.name for s in available_sources]
         )
 
-    @pytest.mark.asyncio
     async def test_health_check_all_sources(self, factory):
         """Test health check for all configured sources"""
         health_status = await factory.health_check_all()
@@ -88,8 +83,7 @@ class TestDataSourceFactoryIntegration:
 
         logger.info("Health check results: %s", health_status)
 
-    @pytest.mark.asyncio
-    async def test_get_source_status(self, factory):
+    def test_get_source_status(self, factory):
         """Test getting status information for all sources"""
 
         status = factory.get_source_status()
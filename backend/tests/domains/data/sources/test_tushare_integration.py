@@ -15,20 +15,19 @@ logger = logging.getLogger(__name__)
 class TestTushareIntegration:
     """Integration tests for Tushare data source with real API calls"""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def tushare_source(self):
         """Create Tushare data source with real toekn from settings"""
         return TushareDataSource(token=settings.TUSHARE_TOKEN, priority=1)
 
-    @pytest.mark.asyncio
-    async def test_tushare_initialization(self, tushare_source):
+    def test_tushare_initialization(self, tushare_source):
         """Test Tushare data source is properly initialized"""
         assert tushare_source is not None
         assert tushare_source.name == "tushare"
         assert tushare_source.priority == 1
         logger.info("Tushare data source initialized successfully")
 
-    @pytest.mark.asyncio
+    @pytest.mark.vcr
     async def test_health_check_real_api(self, tushare_source):
         """Test health check with real Tushare API call"""
         is_healthy = await tushare_source.health_check()
@@ -36,7 +35,7 @@ class TestTushareIntegration:
 
         logger.info("Tushare health check result: %s", is_healthy)
 
-    @pytest.mark.asyncio
+    @pytest.mark.vcr
     async def test_fetch_daily_data_real_api(self, tushare_source):
         """Test fetching real daily data from Tushare API"""
         symbol = "000001.SZ"
@@ -1,7 +1,4 @@
 import pytest
-import pandas as pd
-import numpy as np
-from datetime import datetime, timedelta
 from app.domains.factors.services import factor_service
 from app.domains.factors.base import FactorType
 from app.domains.factors.technical import MovingAverageFactor, RSIFactor, MACDFactor
@@ -18,10 +15,12 @@ class TestFactorService:
     def test_register_and_list_factors(self):
         """Test registering factors and listing them"""
 
-        ma5 = MovingAverageFactor(period=5, ma_type="SMA")
-        ma20 = MovingAverageFactor(period=20, ma_type="SMA")
-        rsi14 = RSIFactor(period=14)
-        macd = MACDFactor(fast_period=12, slow_period=26, signal_period=9)
+        ma5 = MovingAverageFactor(name="MA_5_SMA", period=5, ma_type="SMA")
+        ma20 = MovingAverageFactor(name="MA_20_SMA", period=20, ma_type="SMA")
+        rsi14 = RSIFactor(name="RSI_14", period=14)
+        macd = MACDFactor(
+            name="MACD_12_26_9", fast_period=12, slow_period=26, signal_period=9
+        )
 
         factor_service.register_factor(ma5)
         factor_service.register_factor(ma20)
@@ -38,7 +37,7 @@ class TestFactorService:
 
     def test_get_factor(self):
         """Test getting a specific factor"""
-        ma5 = MovingAverageFactor(period=5, ma_type="SMA")
+        ma5 = MovingAverageFactor(name="MA_5_SMA", period=5, ma_type="SMA")
         factor_service.register_factor(ma5)
 
         factor = factor_service.get_factor("MA_5_SMA")
@@ -46,19 +45,53 @@ class TestFactorService:
         assert factor.name == "MA_5_SMA"
         assert factor.factor_type == FactorType.TECHNICAL
 
+    def test_get_factor_not_found(self):
+        """Test getting an unregistered factor returns None"""
+
+        assert factor_service.get_factor("nonexistent_factor") is None
+        assert factor_service.get_factor_status("nonexistent_factor") is None
+
     def test_get_factors_by_type(self):
         """Test getting factors by type"""
 
-        ma5 = MovingAverageFactor(period=5, ma_type="SMA")
+        ma5 = MovingAverageFactor(name="MA_5_SMA", period=5, ma_type="SMA")
         factor_service.register_factor(ma5)
 
         technical_factors = factor_service.get_factors_by_type(FactorType.TECHNICAL)
         assert len(technical_factors) >= 0
 
+    def test_lookups_refresh_after_registry_changes(
+        self, request: pytest.FixtureRequest
+    ):
+        """Test cached lookups reflect register and unregister"""
+
+        rsi7 = RSIFactor(name="RSI_7", period=7)
+
+        # The service is shared, so any existing RSI_7 is put back afterwards
+        previous = factor_service.get_factor(rsi7.name)
+
+        def restore() -> None:
+            factor_service.unregister_factor(rsi7.name)
+            if previous is not None:
+                factor_service.register_factor(previous)
+
+        request.addfinalizer(restore)
+
+        factor_service.unregister_factor(rsi7.name)
+        assert rsi7.name not in factor_service.list_factors()
+
+        factor_service.register_factor(rsi7)
+        assert rsi7.name in factor_service.list_factors()
+        assert rsi7 in factor_service.get_factors_by_type(FactorType.TECHNICAL)
+
+        factor_service.unregister_factor(rsi7.name)
+        assert rsi7.name not in factor_service.list_factors()
+        assert rsi7 not in factor_service.get_factors_by_type(FactorType.TECHNICAL)
+
     def test_get_factor_status(self):
         """Test getting factor status"""
 
-        ma5 = MovingAverageFactor(period=5, ma_type="SMA")
+        ma5 = MovingAverageFactor(name="MA_5_SMA", period=5, ma_type="SMA")
         factor_service.register_factor(ma5)
 
         status = factor_service.get_factor_status("MA_5_SMA")
@@ -1,6 +1,4 @@
 import pytest
-import pandas as pd
-import numpy as np
 from app.domains.factors.report import MomentumFactor
 
 
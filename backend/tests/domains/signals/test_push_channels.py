@@ -27,6 +27,13 @@ class TestPushResult:
         assert result.success is False
         assert result.error == "Connection failed"
 
+    def test_push_result_is_immutable(self):
+        """Test push results cannot be modified after creation"""
+        result = PushResult(success=True)
+
+        with pytest.raises(AttributeError):
+            result.success = False
+
 
 class TestWeChatWorkChannel:
     """Test WeChat Work push channel"""
@@ -9,37 +9,30 @@ from app.domains.signals.services import SignalPushService
 class TestSignalPushService:
     """Test SignalPushService"""
 
-    def test_service_initialization(self):
+    def test_service_initialization(self, signal_push_service: SignalPushService):
         """Test service can be initialized"""
 
-        service = SignalPushService()
+        assert signal_push_service is not None
+        assert len(signal_push_service.channels) > 0
 
-        assert service is not None
-        assert len(service.channels) > 0
-
-    def test_service_has_channels(self):
+    def test_service_has_channels(self, signal_push_service: SignalPushService):
         """Test service has registered channels"""
 
-        service = SignalPushService()
-
-        assert "wechat" in service.channels or "email" in service.channels
+        channels = signal_push_service.channels
+        assert "wechat" in channels or "email" in channels
 
-    def test_wechat_channel_exists(self):
+    def test_wechat_channel_exists(self, signal_push_service: SignalPushService):
         """Test WeChat channel is registered"""
 
-        service = SignalPushService()
-
-        if "wechat" in service.channels:
-            channel = service.channels["wechat"]
+        if "wechat" in signal_push_service.channels:
+            channel = signal_push_service.channels["wechat"]
 
             assert channel.name == "wechat_work"
 
-    def test_email_channel_exists(self):
+    def test_email_channel_exists(self, signal_push_service: SignalPushService):
         """Test Email channel is registered"""
 
-        service = SignalPushService()
-
-        if "email" in service.channels:
-            channel = service.channels["email"]
+        if "email" in signal_push_service.channels:
+            channel = signal_push_service.channels["email"]
 
             assert channel.name == "email"
@@ -2,10 +2,12 @@
 DualMovingAverageStrategy tests
 """
 
+import numpy as np
 import pytest
 
 from app.domains.strategies.dual_moving_average_strategy import (
     DualMovingAverageStrategy,
+    _crossover_kernel,
 )
 
 
@@ -23,8 +25,93 @@ class TestDualMovingAverageStrategy:
         assert hasattr(DualMovingAverageStrategy, "_generate_signals")
         assert hasattr(DualMovingAverageStrategy, "_execute_trades")
 
+    def test_per_bar_methods_are_synchronous(self):
+        """Test the per-bar path never returns un-awaited coroutines to backtrader"""
+        import inspect
+
+        for method in ("next", "_generate_signals", "_execute_trades"):
+            assert not inspect.iscoroutinefunction(
+                getattr(DualMovingAverageStrategy, method)
+            )
+
     def test_strategy_inheritance(self):
         """Test strategy inherits from correct base classes"""
         from app.domains.strategies.base_strategy import BaseStrategy
 
         assert issubclass(DualMovingAverageStrategy, BaseStrategy)
+
+
+class TestCrossoverKernel:
+    """Test the per-bar crossover kernel"""
+
+    def test_golden_cross(self):
+        """Test short MA crossing above long MA returns 1"""
+        assert _crossover_kernel(9.0, 10.0, 11.0, 10.0) == 1
+
+    def test_death_cross(self):
+        """Test short MA crossing below long MA returns -1"""
+        assert _crossover_kernel(11.0, 10.0, 9.0, 10.0) == -1
+
+    def test_no_cross(self):
+        """Test no crossover returns 0"""
+        assert _crossover_kernel(11.0, 10.0, 12.0, 10.0) == 0
+        assert _crossover_kernel(float("nan"), 10.0, 12.0, 10.0) == 0
+
+
+class TestPrecompute:
+    """Test the vectorized crossover precompute"""
+
+    def test_matches_kernel(self):
+        """Test precomputed codes agree with the per-bar kernel"""
+        short_ma = np.array([9.0, 11.0, 12.0, 9.0, float("nan"), 11.0])
+        long_ma = np.array([10.0, 10.0, 10.0, 10.0, 10.0, 10.0])
+
+        signals = DualMovingAverageStrategy.precompute(short_ma, long_ma)
+
+        assert signals.tolist() == [0, 1, 0, -1, 0, 0]
+        for i in range(1, len(short_ma)):
+            assert signals[i] == _crossover_kernel(
+                short_ma[i - 1], long_ma[i - 1], short_ma[i], long_ma[i]
+            )
+
+    def test_short_input(self):
+        """Test inputs shorter than two bars produce no signals"""
+        signals = DualMovingAverageStrategy.precompute(
+            np.array([1.0]), np.array([2.0])
+        )
+
+        assert signals.tolist() == [0]
+
+
+class TestExecuteTrades:
+    """Test that signals actually reach backtrader's order methods"""
+
+    @staticmethod
+    def _make_strategy(position):
+        from unittest.mock import MagicMock
+
+        strategy = MagicMock()
+        strategy.symbol = "000001.SZ"
+        strategy.position = position
+        strategy.broker.getcash.return_value = 100000.0
+        return strategy
+
+    def test_buy_signal_places_order(self):
+        """Test a buy signal without a position calls buy with a sized order"""
+        strategy = self._make_strategy(position=None)
+        signal = {"action": "buy", "symbol": "000001.SZ", "price": 10.0}
+
+        DualMovingAverageStrategy._execute_trades(strategy, [signal], "2024-01-02")
+
+        strategy.buy.assert_called_once_with(size=9500)
+        strategy._save_signal_to_db.assert_called_once_with(signal, "2024-01-02")
+
+    def test_sell_signal_closes_position(self):
+        """Test a sell signal with an open position calls close"""
+        strategy = self._make_strategy(position=True)
+        signal = {"action": "sell", "symbol": "000001.SZ", "price": 10.0}
+
+        DualMovingAverageStrategy._execute_trades(strategy, [signal], "2024-01-02")
+
+        strategy.close.assert_called_once_with()
+        strategy._save_signal_to_db.assert_called_once_with(signal, "2024-01-02")
@@ -0,0 +1,20 @@
+"""
+Strategy enum tests
+"""
+
+from app.domains.strategies.enums import TradingMode
+
+
+class TestTradingMode:
+    """Test TradingMode enum"""
+
+    def test_trading_mode_enum_values(self):
+        """Test TradingMode enum has all expected values"""
+
+        assert TradingMode.BACKTEST == "backtest"
+        assert TradingMode.PAPER_TRADING == "paper_trading"
+        assert TradingMode.LIVE_TRADING == "live_trading"
+
+        assert TradingMode.BACKTEST != TradingMode.PAPER_TRADING
+        assert TradingMode.BACKTEST != TradingMode.LIVE_TRADING
+        assert TradingMode.PAPER_TRADING != TradingMode.LIVE_TRADING
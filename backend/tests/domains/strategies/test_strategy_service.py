@@ -9,37 +9,67 @@ from app.domains.strategies.services import StrategyService
 class TestStrategyService:
     """Test StrategyService implementation"""
 
-    def test_service_initialization(self):
+    def test_service_initialization(self, strategy_service: StrategyService):
         """Test service can be initialized correctly"""
-        service = StrategyService()
-
-        assert service is not None
+        assert strategy_service is not None
 
-    def test_auto_discover_strategies(self):
+    def test_auto_discover_strategies(self, strategy_service: StrategyService):
         """Test service can auto-discover strategies"""
-        service = StrategyService()
-
-        strategies = service.list_strategies()
+        strategies = strategy_service.list_strategies()
 
         assert len(strategies) > 0
         assert "DualMovingAverageStrategy" in strategies
 
-    def test_get_strategy(self):
+    def test_get_strategy(self, strategy_service: StrategyService):
         """Test service can get a strategy by name"""
-        service = StrategyService()
-
-        strategy_class = service.get_strategy("DualMovingAverageStrategy")
+        strategy_class = strategy_service.get_strategy("DualMovingAverageStrategy")
         assert strategy_class is not None
 
-    def test_register_strategy(self):
+    def test_register_strategy(
+        self, strategy_service: StrategyService, request: pytest.FixtureRequest
+    ):
         """Test service can register a new strategy"""
-        service = StrategyService()
+        from app.domains.strategies.dual_moving_average_strategy import (
+            DualMovingAverageStrategy,
+        )
+
+        # The service is shared, so the registration is undone after the test
+        name = f"TestStrategy_{request.node.name}"
+        request.addfinalizer(lambda: strategy_service.unregister_strategy(name))
 
+        strategy_service.register_strategy(name, DualMovingAverageStrategy)
+
+        strategies = strategy_service.list_strategies()
+        assert name in strategies
+
+    def test_unregister_strategy(
+        self, strategy_service: StrategyService, request: pytest.FixtureRequest
+    ):
+        """Test an unregistered strategy drops out of the listing"""
         from app.domains.strategies.dual_moving_average_strategy import (
             DualMovingAverageStrategy,
         )
 
-        service.register_strategy("TestStrategy", DualMovingAverageStrategy)
+        # Undone even when an assertion below fails, unregistering twice is a no-op
+        request.addfinalizer(
+            lambda: strategy_service.unregister_strategy("TempStrategy")
+        )
+
+        strategy_service.register_strategy("TempStrategy", DualMovingAverageStrategy)
+        assert "TempStrategy" in strategy_service.list_strategies()
+
+        assert strategy_service.unregister_strategy("TempStrategy") is True
+        assert "TempStrategy" not in strategy_service.list_strategies()
+        assert strategy_service.unregister_strategy("TempStrategy") is False
+
+    def test_registrations_stay_per_instance(self, strategy_service: StrategyService):
+        """Test a registration is not seen by services created afterwards"""
+        from app.domains.strategies.dual_moving_average_strategy import (
+            DualMovingAverageStrategy,
+        )
+
+        service = StrategyService()
+        service.register_strategy("LocalStrategy", DualMovingAverageStrategy)
 
-        strategies = service.list_strategies()
-        assert "TestStrategy" in strategies
+        assert "LocalStrategy" not in StrategyService().list_strategies()
+        assert "LocalStrategy" not in strategy_service.list_strategies()
@@ -0,0 +1,39 @@
+"""
+Service surface tests
+
+Checks that the domain services expose what the other modules call on them
+"""
+
+from app.domains.data.services import data_service
+from app.domains.factors.services import factor_service
+from app.domains.signals.services import signal_push_service
+from app.domains.strategies.services import StrategyService
+
+
+class TestServiceSurface:
+    """Test the attributes the domain services share with each other"""
+
+    def test_all_services_initialized(self, strategy_service: StrategyService):
+        """Test all services can be initialized"""
+        assert data_service is not None
+        assert factor_service is not None
+        assert signal_push_service is not None
+
+        assert strategy_service is not None
+
+    def test_services_have_required_attributes(
+        self, strategy_service: StrategyService
+    ):
+        """Test all services have required attributes"""
+
+        assert hasattr(data_service, "data_source_factory")
+        assert hasattr(data_service, "fetch_data")
+
+        assert hasattr(factor_service, "factors")
+        assert hasattr(factor_service, "register_factor")
+
+        assert hasattr(signal_push_service, "channels")
+        assert hasattr(signal_push_service, "push_signal")
+
+        assert hasattr(strategy_service, "strategies")
+        assert hasattr(strategy_service, "run_backtest")
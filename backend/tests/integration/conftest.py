@@ -0,0 +1,61 @@
+from collections.abc import Generator
+
+import numpy as np
+import pandas as pd
+import pytest
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
+
+from app.domains.strategies.services import StrategyService
+from tests.utils.data import MockDataService
+
+
+@pytest.fixture(scope="session")
+def mock_ohlcv() -> pd.DataFrame:
+    """Daily OHLCV bars for January 2024, shared read-only by the backtest tests"""
+    dates = pd.date_range(start="2024-01-01", end="2024-01-31", freq="D")
+    i = np.arange(len(dates))
+    price = 10.0 + i * 0.1 + (i % 5) * 0.2
+    return pd.DataFrame(
+        {
+            "timestamp": dates,
+            "open": price * 0.99,
+            "high": price * 1.02,
+            "low": price * 0.98,
+            "close": price,
+            "volume": 1000000 + i * 10000,
+        }
+    )
+
+
+@pytest.fixture
+def mock_data_service(mock_ohlcv: pd.DataFrame) -> MockDataService:
+    return MockDataService(mock_ohlcv)
+
+
+@pytest.fixture
+def strategy_service_with_mock_data(
+    mock_data_service: MockDataService,
+) -> StrategyService:
+    """A fresh StrategyService whose data groups fetch from mock_data_service"""
+    service = StrategyService()
+    service.data_service = mock_data_service
+    return service
+
+
+@pytest.fixture
+def backtest_session() -> Generator[Session, None, None]:
+    """Empty in-memory SQLite session for run_backtest to record results in"""
+    # cerebro.run flushes signals from a worker thread, so the single
+    # connection has to be shareable across threads
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        yield session
+
+    engine.dispose()
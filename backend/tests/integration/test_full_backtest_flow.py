@@ -4,9 +4,17 @@ Full backtest flow integration test
 Tests the complete flow: Data -> Factor -> Strategy -> Backtest
 """
 
+from uuid import UUID
+
+import numpy as np
+import pandas as pd
 import pytest
-from unittest.mock import AsyncMock, patch
+from sqlmodel import select
 
+from app.models import BacktestResult, Signal
+from app.domains.strategies.dual_moving_average_strategy import (
+    DualMovingAverageStrategy,
+)
 from app.domains.strategies.services import StrategyService
 from app.domains.strategies.enums import TradingMode
 from app.domains.data.services import DataService
@@ -15,8 +23,8 @@ from app.domains.data.services import DataService
 class TestFullBacktestFlow:
     """Test complete backtest flow"""
 
-    @pytest.mark.asyncio
-    async def test_backtest_flow_with_real_data(self):
+    @pytest.mark.integration
+    async def test_backtest_flow_with_real_data(self, backtest_session):
         """Test backtest flow with real data"""
 
         data_service = DataService()
@@ -38,6 +46,7 @@ class TestFullBacktestFlow:
         assert "DualMovingAverageStrategy" in strategies
 
         result = await strategy_service.run_backtest(
+            session=backtest_session,
             strategy_name="DualMovingAverageStrategy",
             symbol="000001.SZ",
             start_date="2024-01-01",
@@ -71,210 +80,175 @@ class TestFullBacktestFlow:
         assert isinstance(result["performance"]["total_return"], (int, float))
         assert isinstance(result["performance"]["max_drawdown"], (int, float))
 
-    @pytest.mark.asyncio
-    async def test_backtest_invalid_strategy(self):
+    def test_backtest_invalid_strategy(self):
         """Test backtest with invalid strategy name raises error"""
 
         strategy_service = StrategyService()
 
+        # run_backtest resolves the strategy through this check before any
+        # async work, so the lookup is tested without an event loop
         with pytest.raises(ValueError, match="Strategy .* not found"):
-            await strategy_service.run_backtest(
-                strategy_name="NonExistentStrategy",
-                symbol="000001.SZ",
-                start_date="2024-01-01",
-                end_date="2024-01-31",
-                initial_capital=1000000.0,
-                mode=TradingMode.BACKTEST,
-            )
+            strategy_service._require_strategy("NonExistentStrategy")
 
-    @pytest.mark.asyncio
-    async def test_backtest_flow_with_mock_data(self):
+    async def test_backtest_flow_with_mock_data(
+        self, strategy_service_with_mock_data, mock_data_service, backtest_session
+    ):
         """Test backtest flow with mock data"""
-        import pandas as pd
-
-        def create_mock_data(start_date: str, end_date: str) -> pd.DataFrame:
-            """Create mock OHLCV data for testing"""
-
-            start = pd.to_datetime(start_date)
-            end = pd.to_datetime(end_date)
-            dates = pd.date_range(start=start, end=end, freq="D")
-
-            base_price = 10.0
-            data = []
-            for i, date in enumerate(dates):
-                price = base_price + i * 0.1 + (i % 5) * 0.2
-                high = price * 1.02
-                low = price * 0.98
-                open_price = price * 0.99
-                close_price = price
-                volume = 1000000 + i * 10000
-
-                data.append(
-                    {
-                        "timestamp": date,
-                        "open": open_price,
-                        "high": high,
-                        "low": low,
-                        "close": close_price,
-                        "volume": volume,
-                    }
-                )
-
-            df = pd.DataFrame(data)
-            return df
-
-        mock_data = create_mock_data("2024-01-01", "2024-01-31")
-
-        with patch.object(
-            DataService, "fetch_data", new_callable=AsyncMock
-        ) as mock_fetch:
-            mock_fetch.return_value = mock_data
-
-            strategy_service = StrategyService()
-
-            original_data_service = strategy_service.data_service
-            strategy_service.data_service = DataService()
-            strategy_service.data_service.fetch_data = mock_fetch
-
-            result = await strategy_service.run_backtest(
-                strategy_name="DualMovingAverageStrategy",
-                symbol="000001.SZ",
-                start_date="2024-01-01",
-                end_date="2024-01-31",
-                initial_capital=1000000.0,
-                mode=TradingMode.BACKTEST,
-            )
 
-            strategy_service.data_service = original_data_service
+        result = await strategy_service_with_mock_data.run_backtest(
+            session=backtest_session,
+            strategy_name="DualMovingAverageStrategy",
+            symbol="000001.SZ",
+            start_date="2024-01-01",
+            end_date="2024-01-31",
+            initial_capital=1000000.0,
+            mode=TradingMode.BACKTEST,
+        )
+
+        assert result is not None
+        assert result["strategy_name"] == "DualMovingAverageStrategy"
+        assert result["symbol"] == "000001.SZ"
+        assert result["initial_capital"] == 1000000.0
+        assert isinstance(result["performance"]["final_value"], (int, float))
+        assert "total_return" in result["performance"]
+        assert "max_drawdown" in result["performance"]
+        assert mock_data_service.calls > 0
 
-            assert result is not None
-            assert result["strategy_name"] == "DualMovingAverageStrategy"
-            assert result["symbol"] == "000001.SZ"
-            assert result["initial_capital"] == 1000000.0
-            assert isinstance(result["performance"]["final_value"], (int, float))
-            assert "total_return" in result["performance"]
-            assert "max_drawdown" in result["performance"]
+        stored = backtest_session.get(BacktestResult, UUID(result["backtest_id"]))
+        assert stored is not None
+        assert stored.status == "completed"
 
-    @pytest.mark.asyncio
-    async def test_backtest_result_completeness(self):
+    async def test_backtest_result_completeness(
+        self, strategy_service_with_mock_data, backtest_session
+    ):
         """Test that backtest result contains all required performance metrics"""
-        import pandas as pd
-        from unittest.mock import AsyncMock, patch
-        from app.domains.data.services import DataService
-
-        def create_mock_data(start_date: str, end_date: str) -> pd.DataFrame:
-            start = pd.to_datetime(start_date)
-            end = pd.to_datetime(end_date)
-            dates = pd.date_range(start=start, end=end, freq="D")
-            base_price = 10.0
-            data = []
-            for i, date in enumerate(dates):
-                price = base_price + i * 0.1 + (i % 5) * 0.2
-                data.append(
-                    {
-                        "timestamp": date,
-                        "open": price * 0.99,
-                        "high": price * 1.02,
-                        "low": price * 0.98,
-                        "close": price,
-                        "volume": 1000000 + i * 10000,
-                    }
-                )
-
-            return pd.DataFrame(data)
-
-        mock_data = create_mock_data("2024-01-01", "2024-01-31")
-
-        with patch.object(
-            DataService, "fetch_data", new_callable=AsyncMock
-        ) as mock_fetch:
-            mock_fetch.return_value = mock_data
-            strategy_service = StrategyService()
-            original_data_service = strategy_service.data_service
-            strategy_service.data_service = DataService()
-            strategy_service.data_service.fetch_data = mock_fetch
-
-            result = await strategy_service.run_backtest(
+
+        result = await strategy_service_with_mock_data.run_backtest(
+            session=backtest_session,
+            strategy_name="DualMovingAverageStrategy",
+            symbol="000001.SZ",
+            start_date="2024-01-01",
+            end_date="2024-01-31",
+            initial_capital=1000000.0,
+            mode=TradingMode.BACKTEST,
+        )
+
+        assert "backtest_id" in result
+        assert "strategy_name" in result
+        assert "symbol" in result
+        assert "start_date" in result
+        assert "end_date" in result
+        assert "initial_capital" in result
+        assert "performance" in result
+        assert "chart_path" in result
+        assert "status" in result
+
+        perf = result["performance"]
+        assert "final_value" in perf
+        assert "total_return" in perf
+        assert "total_return_pct" in perf
+        assert "max_drawdown" in perf
+
+    @pytest.mark.parametrize(
+        "initial_capital", [100000.0, 500000.0, 1000000.0, 5000000.0]
+    )
+    async def test_backtest_with_different_initial_capital(
+        self, strategy_service_with_mock_data, backtest_session, initial_capital
+    ):
+        """Test backtest with different initial capital amounts"""
+
+        result = await strategy_service_with_mock_data.run_backtest(
+            session=backtest_session,
+            strategy_name="DualMovingAverageStrategy",
+            symbol="000001.SZ",
+            start_date="2024-01-01",
+            end_date="2024-01-31",
+            initial_capital=initial_capital,
+            mode=TradingMode.BACKTEST,
+        )
+
+        assert result["initial_capital"] == initial_capital
+        assert result["performance"]["final_value"] > 0
+        assert result["performance"]["final_value"] >= initial_capital * 0.5
+        assert result["performance"]["final_value"] <= initial_capital * 2.0
+
+
+@pytest.fixture
+def crossing_service(strategy_service_with_mock_data, mock_data_service):
+    """Mock-data service over a down-up-down series, so MA5 crosses MA20 both ways"""
+    legs = np.concatenate(
+        [np.linspace(20.0, 10.0, 30), np.linspace(10.0, 20.0, 30)[1:]]
+    )
+    price = np.concatenate([legs, np.linspace(20.0, 10.0, 30)[1:]])
+    mock_data_service.data = pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2024-01-01", periods=len(price), freq="D"),
+            "open": price,
+            "high": price * 1.01,
+            "low": price * 0.99,
+            "close": price,
+            "volume": np.full(len(price), 1000000),
+        }
+    )
+    return strategy_service_with_mock_data
+
+
+class TestBacktestSignalPersistence:
+    """Test signals reach the database in one insert when the run ends"""
+
+    async def test_signals_inserted_at_end_of_run(
+        self, crossing_service, backtest_session
+    ):
+        """Test queued signals map onto Signal columns and get their defaults"""
+
+        result = await crossing_service.run_backtest(
+            session=backtest_session,
+            strategy_name="DualMovingAverageStrategy",
+            symbol="000001.SZ",
+            start_date="2024-01-01",
+            end_date="2024-03-29",
+        )
+
+        backtest_id = UUID(result["backtest_id"])
+        signals = backtest_session.exec(
+            select(Signal)
+            .where(Signal.backtest_id == backtest_id)
+            .order_by(Signal.signal_time)
+        ).all()
+
+        assert [signal.status for signal in signals] == ["buy", "sell"]
+        for signal in signals:
+            assert signal.id is not None
+            assert signal.push_status == "not_pushed"
+            assert signal.strategy_name == "DualMovingAverageStrategy"
+            assert signal.symbol == "000001.SZ"
+            assert signal.price > 0
+            assert signal.message
+            assert signal.signal_time.hour == 0
+
+    async def test_failed_run_persists_no_signals(
+        self, crossing_service, backtest_session, monkeypatch
+    ):
+        """Test a run that raises before stop() drops its queued signals"""
+
+        execute_trades = DualMovingAverageStrategy._execute_trades
+
+        def execute_then_fail(self, signals, current_date):
+            execute_trades(self, signals, current_date)
+            if self._pending_signals:
+                raise RuntimeError("strategy failed mid-run")
+
+        monkeypatch.setattr(
+            DualMovingAverageStrategy, "_execute_trades", execute_then_fail
+        )
+
+        with pytest.raises(RuntimeError, match="failed mid-run"):
+            await crossing_service.run_backtest(
+                session=backtest_session,
                 strategy_name="DualMovingAverageStrategy",
                 symbol="000001.SZ",
                 start_date="2024-01-01",
-                end_date="2024-01-31",
-                initial_capital=1000000.0,
-                mode=TradingMode.BACKTEST,
+                end_date="2024-03-29",
             )
 
-            strategy_service.data_service = original_data_service
-
-            assert "backtest_id" in result
-            assert "strategy_name" in result
-            assert "symbol" in result
-            assert "start_date" in result
-            assert "end_date" in result
-            assert "initial_capital" in result
-            assert "performance" in result
-            assert "chart_path" in result
-            assert "status" in result
-
-            perf = result["performance"]
-            assert "final_value" in perf
-            assert "total_return" in perf
-            assert "total_return_pct" in perf
-            assert "max_drawdown" in perf
-
-    @pytest.mark.asyncio
-    async def test_backtest_with_different_initial_capital(self):
-        """Test backtest with different initial capital amounts"""
-
-        import pandas as pd
-        from unittest.mock import AsyncMock, patch
-        from app.domains.data.services import DataService
-
-        def create_mock_data(start_date: str, end_date: str) -> pd.DataFrame:
-            start = pd.to_datetime(start_date)
-            end = pd.to_datetime(end_date)
-            dates = pd.date_range(start=start, end=end, freq="D")
-            base_price = 10.0
-            data = []
-            for i, date in enumerate(dates):
-                price = base_price + i * 0.1 + (i % 5) * 0.2
-                data.append(
-                    {
-                        "timestamp": date,
-                        "open": price * 0.99,
-                        "high": price * 1.02,
-                        "low": price * 0.98,
-                        "close": price,
-                        "volume": 1000000 + i * 10000,
-                    }
-                )
-
-            return pd.DataFrame(data)
-
-        mock_data = create_mock_data("2024-01-01", "2024-01-31")
-        with patch.object(
-            DataService, "fetch_data", new_callable=AsyncMock
-        ) as mock_fetch:
-            mock_fetch.return_value = mock_data
-            strategy_service = StrategyService()
-            original_data_service = strategy_service.data_service
-            strategy_service.data_service = DataService()
-            strategy_service.data_service.fetch_data = mock_fetch
-
-            test_capitals = [100000.0, 500000.0, 1000000.0, 5000000.0]
-
-            for initial_capital in test_capitals:
-                result = await strategy_service.run_backtest(
-                    strategy_name="DualMovingAverageStrategy",
-                    symbol="000001.SZ",
-                    start_date="2024-01-01",
-                    end_date="2024-01-31",
-                    initial_capital=initial_capital,
-                    mode=TradingMode.BACKTEST,
-                )
-
-                assert result["initial_capital"] == initial_capital
-                assert result["performance"]["final_value"] > 0
-                assert result["performance"]["final_value"] >= initial_capital * 0.5
-                assert result["performance"]["final_value"] <= initial_capital * 2.0
-
-            strategy_service.data_service = original_data_service
+        assert backtest_session.exec(select(Signal)).all() == []
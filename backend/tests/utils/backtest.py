@@ -0,0 +1,35 @@
+import json
+from typing import Any
+
+from app.models import BacktestResult
+
+SEEDED_STRATEGY = "test_strategy"
+# Enough rows to span three pages of ten
+PAGED_STRATEGY = "paged_strategy"
+PAGED_COUNT = 25
+
+_BACKTEST_RESULT_DEFAULTS: dict[str, Any] = {
+    "strategy_name": SEEDED_STRATEGY,
+    "symbol": "000001.SZ",
+    "start_date": "2023-01-01",
+    "end_date": "2023-12-31",
+    "initial_capital": 1000000.0,
+    "final_value": 1050000.0,
+    "total_return": 0.05,
+    "max_drawdown": -0.03,
+    "sharpe_ratio": 1.2,
+    "total_trades": 25,
+    "winning_trades": 15,
+    "losing_trades": 10,
+    "win_rate": 0.6,
+    "result_data": json.dumps(
+        {"performance": {"total_return_pct": 0.05, "calmar_ratio": 1.2}}
+    ),
+    "created_by": "test@example.com",
+}
+
+
+def make_backtest_result(**overrides: Any) -> BacktestResult:
+    # Table models skip Pydantic validation in __init__ already, and the
+    # constructor is what sets up the SQLAlchemy state session.add() needs
+    return BacktestResult(**{**_BACKTEST_RESULT_DEFAULTS, **overrides})
@@ -0,0 +1,27 @@
+import asyncio
+from typing import Any
+
+import pandas as pd
+
+
+class MockDataService:
+    """Stands in for DataService, answering every fetch with one preset frame"""
+
+    def __init__(
+        self,
+        data: pd.DataFrame,
+        latency: float = 0.0,
+        error: Exception | None = None,
+    ):
+        self.data = data
+        self.latency = latency
+        self.error = error
+        self.calls = 0
+
+    async def fetch_data(self, **kwargs: Any) -> pd.DataFrame:
+        self.calls += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self.error is not None:
+            raise self.error
+        return self.data
@@ -1,9 +1,12 @@
+from datetime import timedelta
+
 from fastapi.testclient import TestClient
 from sqlmodel import Session
 
 from app import crud
+from app.core import security
 from app.core.config import settings
-from app.models import User, UserCreate, UserUpdate
+from app.models import User, UserCreate
 from tests.utils.utils import random_email, random_lower_string
 
 
@@ -19,6 +22,19 @@ def user_authentication_headers(
     return headers
 
 
+def token_headers_for_user(user: User) -> dict[str, str]:
+    """
+    Sign an access token for the user directly.
+
+    Same token the login route issues, without the password check round trip.
+    """
+    access_token = security.create_access_token(
+        user.id,
+        expires_delta=timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES),
+    )
+    return {"Authorization": f"Bearer {access_token}"}
+
+
 def create_random_user(db: Session) -> User:
     email = random_email()
     password = random_lower_string()
@@ -27,23 +43,15 @@ def create_random_user(db: Session) -> User:
     return user
 
 
-def authentication_token_from_email(
-    *, client: TestClient, email: str, db: Session
-) -> dict[str, str]:
+def authentication_token_from_email(*, email: str, db: Session) -> dict[str, str]:
     """
     Return a valid token for the user with given email.
 
     If the user doesn't exist it is created first.
     """
-    password = random_lower_string()
     user = crud.get_user_by_email(session=db, email=email)
     if not user:
-        user_in_create = UserCreate(email=email, password=password)
+        user_in_create = UserCreate(email=email, password=random_lower_string())
         user = crud.create_user(session=db, user_create=user_in_create)
-    else:
-        user_in_update = UserUpdate(password=password)
-        if not user.id:
-            raise Exception("User id not set")
-        user = crud.update_user(session=db, db_user=user, user_in=user_in_update)
 
-    return user_authentication_headers(client=client, email=email, password=password)
+    return token_headers_for_user(user)
@@ -1,9 +1,13 @@
 import random
 import string
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any
 
 from fastapi.testclient import TestClient
 
 from app.core.config import settings
+from app.main import app
 
 
 def random_lower_string() -> str:
@@ -24,3 +28,24 @@ def get_superuser_token_headers(client: TestClient) -> dict[str, str]:
     a_token = tokens["access_token"]
     headers = {"Authorization": f"Bearer {a_token}"}
     return headers
+
+
+@contextmanager
+def override_dep(
+    dependency: Callable[..., Any], override: Callable[..., Any]
+) -> Iterator[None]:
+    """
+    Override a dependency on the shared app for the duration of the block.
+
+    The previous override, if any, is restored on exit so session-scoped
+    clients never see another test's overrides.
+    """
+    previous = app.dependency_overrides.get(dependency)
+    app.dependency_overrides[dependency] = override
+    try:
+        yield
+    finally:
+        if previous is None:
+            app.dependency_overrides.pop(dependency, None)
+        else:
+            app.dependency_overrides[dependency] = previous